@@ -80,6 +80,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 RUSLE API shutting down...")
+    await sentinel_client.close_http_client()
 
 
 # ========== APP INITIALIZATION ==========
@@ -205,9 +206,12 @@ async def compute_rusle(request: schemas.RUSLERequest) -> schemas.RUSLEResponse:
     
     logger.info(f"Received RUSLE request with {len(request.coordinates)} coordinates")
     
+    # Convert the Coordinate models once; every step below reads this array
+    ring = validators.coords_to_array(request.coordinates)
+    
     # ========== STEP 1: VALIDATE POLYGON (FIXED: now calling validators) ==========
     try:
-        validation_metadata = validators.validate_full_polygon(request.coordinates)
+        validation_metadata = validators.validate_full_polygon(ring)
         logger.info(
             f"Polygon validated: {validation_metadata['area_km2']:.2f} km², "
             f"{validation_metadata['num_vertices']} vertices"
@@ -222,7 +226,7 @@ async def compute_rusle(request: schemas.RUSLERequest) -> schemas.RUSLEResponse:
     
     # ========== STEP 2: PARSE TO GEOJSON ==========
     try:
-        geojson = coordinate_parser.parse_to_geojson(request.coordinates)
+        geojson = coordinate_parser.parse_to_geojson(ring)
         logger.info(f"Converted to GeoJSON with buffer")
     except Exception as e:
         logger.error(f"GeoJSON conversion failed: {e}")
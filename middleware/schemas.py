@@ -6,6 +6,7 @@ Defines data contracts between frontend and FastAPI middleware
 from pydantic import BaseModel, Field, validator, model_validator
 from typing import List, Dict, Optional, Any
 from datetime import datetime
+import numpy as np
 
 
 # ========== REQUEST MODELS (Frontend → FastAPI) ==========
@@ -33,6 +34,10 @@ class Coordinate(BaseModel):
         description="Height/elevation (ignored in current implementation)"
     )
     
+    def __array__(self, dtype=None):
+        """[longitude, latitude] as a length-2 array, so np.asarray(coords) gives (N, 2)"""
+        return np.array((self.longitude, self.latitude), dtype=dtype or np.float64)
+    
     class Config:
         schema_extra = {
             "example": {
@@ -16,6 +16,8 @@ from .coordinate_parser import (
 
 from .sentinel_client import (
     fetch_satellite_image,
+    fetch_satellite_images,
+    fetch_rgb_and_ndvi,
     get_auth_token
 )
 
@@ -34,6 +36,8 @@ __all__ = [
     
     # Satellite imagery
     'fetch_satellite_image',
+    'fetch_satellite_images',
+    'fetch_rgb_and_ndvi',
     'get_auth_token',
     
     # Backend communication
@@ -4,14 +4,17 @@ Converts frontend coordinate arrays to GeoJSON format for backend/GEE processing
 Handles buffering, area calculation, and coordinate transformations
 """
 
+import shapely
 from shapely.geometry import Polygon, Point, mapping, shape
-from shapely.ops import transform
-from pyproj import Geod, Transformer
-from typing import List, Dict, Tuple, Optional
+from pyproj import Transformer
+from typing import List, Dict, Tuple, Optional, Union
+from functools import lru_cache
+import numpy as np
+import orjson
 import logging
-import json
 
 import schemas  # Import Coordinate model
+from validators import GEOD, KM_PER_DEG, coords_to_array  # Shared with the polygon validators
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +24,61 @@ logger = logging.getLogger(__name__)
 # Default buffer in degrees (~1.1 km at equator for 0.01°)
 DEFAULT_BUFFER_DEG = 0.01
 
-# Geodesic calculator (WGS84 ellipsoid)
-GEOD = Geod(ellps="WGS84")
+# CRS reported in GeoJSON properties (WGS84)
+PROPERTIES_CRS = "EPSG:4326"
+
+# Fixed key layout of the GeoJSON properties block
+_PROPERTY_KEYS = (
+    "area_km2",
+    "area_hectares",
+    "area_m2",
+    "perimeter_km",
+    "perimeter_m",
+    "centroid",
+    "bbox",
+    "num_vertices",
+    "buffer_applied_deg",
+    "buffer_applied_km",
+    "crs",
+)
+
+
+# ========== ARRAY HELPERS ==========
+
+def _signed_area_deg2(arr: np.ndarray) -> float:
+    """
+    Signed planar polygon area in degrees² using the shoelace formula
+    Positive for counter-clockwise rings, negative for clockwise.
+    Works on open or closed rings (a repeated closing vertex adds zero)
+    
+    Args:
+        arr: (N, 2) array of [lon, lat] vertices
+    
+    Returns:
+        Signed area in degrees²
+    """
+    x = arr[:, 0]
+    y = arr[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _shoelace_area_deg2(arr: np.ndarray) -> float:
+    """
+    Planar polygon area in degrees² using the shoelace formula
+    
+    Args:
+        arr: (N, 2) array of [lon, lat] vertices
+    
+    Returns:
+        Unsigned area in degrees²
+    """
+    return abs(_signed_area_deg2(arr))
 
 
 # ========== CORE FUNCTIONS ==========
 
 def parse_to_geojson(
-    coords: List[schemas.Coordinate],
+    coords: Union[List[schemas.Coordinate], np.ndarray],
     buffer_deg: float = DEFAULT_BUFFER_DEG,
     include_properties: bool = True
 ) -> Dict:
@@ -39,7 +89,7 @@ def parse_to_geojson(
     Without buffer, edge pixels may be partially clipped leading to data loss.
     
     Args:
-        coords: List of Coordinate objects from API request
+        coords: List of Coordinate objects from API request (or their (N, 2) array)
         buffer_deg: Buffer distance in degrees (default 0.01° ≈ 1.1 km at equator)
         include_properties: Whether to calculate and include metadata properties
     
@@ -68,28 +118,65 @@ def parse_to_geojson(
         >>> geojson = parse_to_geojson(coords)
         >>> print(geojson['properties']['area_km2'])
         25.3
+    
+    Note:
+        Results are memoized on (lon/lat bytes, buffer_deg, include_properties)
+        as serialized JSON, so every call returns a fresh dict that is safe to mutate.
     """
-    logger.info(f"Parsing {len(coords)} coordinates to GeoJSON with {buffer_deg}° buffer")
+    # Step 1: Extract lon/lat pairs (ignore height for 2D RUSLE); the raw
+    # float64 bytes are an exact, hashable cache key
+    points = coords_to_array(coords).tobytes()
     
-    # Step 1: Extract lon/lat pairs (ignore height for 2D RUSLE)
-    points = [(c.longitude, c.latitude) for c in coords]
+    return orjson.loads(_build_geojson(points, buffer_deg, include_properties))
+
+
+@lru_cache(maxsize=128)
+def _build_geojson(
+    points: bytes,
+    buffer_deg: float,
+    include_properties: bool
+) -> bytes:
+    """
+    Cached worker behind parse_to_geojson (hashable lon/lat bytes input)
+    Caches the serialized Feature rather than the dict, so no caller can
+    mutate a cache entry
     
-    # Step 2: Create Shapely polygon
-    try:
-        poly = Polygon(points)
-    except Exception as e:
-        logger.error(f"Failed to create polygon: {e}")
-        raise ValueError(f"Cannot create polygon from coordinates: {str(e)}")
+    Args:
+        points: Raw bytes of the (N, 2) float64 lon/lat array
+        buffer_deg: Buffer distance in degrees
+        include_properties: Whether to calculate and include metadata properties
     
-    # Step 3: Apply buffer if specified
+    Returns:
+        GeoJSON Feature as orjson-encoded bytes
+    """
+    # Step 2: View the bytes as a (N, 2) array and pre-validate before touching GEOS
+    ring = np.frombuffer(points, dtype=np.float64).reshape(-1, 2)
+    logger.info("Parsing %d coordinates to GeoJSON with %s° buffer", len(ring), buffer_deg)
+    if not np.isfinite(ring).all():
+        raise ValueError("Cannot create polygon from coordinates: non-finite longitude/latitude")
+    
+    # Close the ring if needed
+    if len(ring) and not np.array_equal(ring[0], ring[-1]):
+        ring = np.vstack([ring, ring[:1]])
+    
+    if len(ring) < 4:
+        raise ValueError(
+            f"Cannot create polygon from coordinates: need at least 3 distinct vertices, "
+            f"got {max(len(ring) - 1, 0)}"
+        )
+    
+    # Step 3: Create Shapely polygon
+    poly = Polygon(ring)
+    
+    # Step 4: Apply buffer if specified and convert to GeoJSON geometry
     if buffer_deg > 0:
         buffered_poly = poly.buffer(buffer_deg)
-        logger.debug(f"Applied {buffer_deg}° buffer to polygon")
+        geometry = mapping(buffered_poly)
+        logger.debug("Applied %s° buffer to polygon", buffer_deg)
     else:
+        # Unbuffered ring is already in hand; skip the mapping() walk
         buffered_poly = poly
-    
-    # Step 4: Convert to GeoJSON geometry
-    geometry = mapping(buffered_poly)
+        geometry = {"type": "Polygon", "coordinates": [ring.tolist()]}
     
     # Step 5: Calculate properties (metadata)
     properties = {}
@@ -104,11 +191,17 @@ def parse_to_geojson(
     }
     
     logger.info(
-        f"GeoJSON created: {properties.get('area_km2', 0):.2f} km², "
-        f"{properties.get('num_vertices', 0)} vertices"
+        "GeoJSON created: %.2f km², %d vertices",
+        properties.get('area_km2', 0), properties.get('num_vertices', 0)
     )
     
-    return geojson
+    return orjson.dumps(geojson, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def clear_geojson_cache():
+    """Clear memoized parse_to_geojson results"""
+    _build_geojson.cache_clear()
+    logger.debug("Cleared GeoJSON parse cache")
 
 
 def calculate_polygon_properties(poly: Polygon, buffer_applied: float = 0) -> Dict:
@@ -123,47 +216,102 @@ def calculate_polygon_properties(poly: Polygon, buffer_applied: float = 0) -> Di
     Returns:
         Dictionary of polygon properties
     """
-    # Calculate geodesic area (accounts for Earth curvature)
-    area_km2 = calculate_geodesic_area(poly)
-    
-    # Calculate perimeter
-    area_m2, perimeter_m = GEOD.geometry_area_perimeter(poly)
+    # Geodesic area and perimeter in one pass (accounts for Earth curvature)
+    area_m2, perimeter_m = _geodesic_area_perimeter(poly)
     
     # Get centroid
     centroid = poly.centroid
     
-    # Get bounding box
-    minx, miny, maxx, maxy = poly.bounds
+    return _build_properties(
+        area_m2=area_m2,
+        perimeter_m=perimeter_m,
+        centroid=(centroid.x, centroid.y),
+        bounds=poly.bounds,
+        num_vertices=len(poly.exterior.coords),
+        buffer_applied=buffer_applied
+    )
+
+
+def _build_properties(
+    area_m2: float,
+    perimeter_m: float,
+    centroid: Tuple[float, float],
+    bounds: Tuple[float, float, float, float],
+    num_vertices: int,
+    buffer_applied: float
+) -> Dict:
+    """
+    Assemble the GeoJSON properties block from precomputed measurements
+    
+    Args:
+        area_m2: Geodesic area in m² (sign ignored)
+        perimeter_m: Geodesic perimeter in meters
+        centroid: (lon, lat) of the centroid
+        bounds: (minx, miny, maxx, maxy)
+        num_vertices: Exterior ring vertex count (including closing vertex)
+        buffer_applied: Buffer distance applied (for metadata)
     
-    # Count vertices
-    num_vertices = len(poly.exterior.coords)
+    Returns:
+        Dictionary of polygon properties
+    """
+    area_km2 = abs(area_m2) / 1_000_000
+    minx, miny, maxx, maxy = bounds
     
-    properties = {
+    # Values in _PROPERTY_KEYS order. Rounding happens here rather than at
+    # serialization: centroid/bbox feed PolygonMetadata directly, and a dozen
+    # scalar round() calls are cheaper than packing them into a numpy array
+    return dict(zip(_PROPERTY_KEYS, (
         # Area metrics
-        "area_km2": round(area_km2, 4),
-        "area_hectares": round(area_km2 * 100, 2),
-        "area_m2": round(abs(area_m2), 2),
+        round(area_km2, 4),
+        round(area_km2 * 100, 2),
+        round(abs(area_m2), 2),
         
         # Perimeter
-        "perimeter_km": round(perimeter_m / 1000, 3),
-        "perimeter_m": round(perimeter_m, 2),
+        round(perimeter_m / 1000, 3),
+        round(perimeter_m, 2),
         
         # Centroid [longitude, latitude]
-        "centroid": [round(centroid.x, 6), round(centroid.y, 6)],
+        [round(centroid[0], 6), round(centroid[1], 6)],
         
         # Bounding box [minx, miny, maxx, maxy]
-        "bbox": [round(minx, 6), round(miny, 6), round(maxx, 6), round(maxy, 6)],
+        [round(minx, 6), round(miny, 6), round(maxx, 6), round(maxy, 6)],
         
         # Geometry info
-        "num_vertices": num_vertices,
-        "buffer_applied_deg": buffer_applied,
-        "buffer_applied_km": round(buffer_applied * 111.32, 2),  # Approx km at equator
+        num_vertices,
+        buffer_applied,
+        round(buffer_applied * KM_PER_DEG, 2),  # Approx km at equator
         
         # Coordinate reference system
-        "crs": "EPSG:4326"  # WGS84
-    }
+        PROPERTIES_CRS
+    )))
+
+
+def _geodesic_area_perimeter(poly: Polygon) -> Tuple[float, float]:
+    """
+    Geodesic area and perimeter from the polygon's raw ring arrays
+    Hands contiguous lon/lat arrays straight to Geod.polygon_area_perimeter
+    instead of letting geometry_area_perimeter walk the Shapely geometry
+    
+    Args:
+        poly: Shapely Polygon (or MultiPolygon) in WGS84
+    
+    Returns:
+        Tuple of (unsigned area in m², exterior perimeter in m), holes subtracted
+    """
+    if hasattr(poly, "geoms"):
+        parts = [_geodesic_area_perimeter(part) for part in poly.geoms]
+        return sum(a for a, _ in parts), sum(p for _, p in parts)
+    
+    ring = np.asarray(poly.exterior.coords)
+    area_m2, perimeter_m = GEOD.polygon_area_perimeter(ring[:, 0], ring[:, 1])
+    area_m2 = abs(area_m2)
     
-    return properties
+    for interior in poly.interiors:
+        ring = np.asarray(interior.coords)
+        hole_m2, _ = GEOD.polygon_area_perimeter(ring[:, 0], ring[:, 1])
+        area_m2 -= abs(hole_m2)
+    
+    return area_m2, perimeter_m
 
 
 def calculate_geodesic_area(poly: Polygon) -> float:
@@ -182,13 +330,14 @@ def calculate_geodesic_area(poly: Polygon) -> float:
         Geodesic area accounts for meridian convergence and Earth's spheroid shape.
     """
     try:
-        area_m2, _ = GEOD.geometry_area_perimeter(poly)
+        area_m2, _ = _geodesic_area_perimeter(poly)
         area_km2 = abs(area_m2) / 1_000_000
         return area_km2
     except Exception as e:
-        logger.warning(f"Geodesic area calculation failed, using planar fallback: {e}")
+        logger.warning("Geodesic area calculation failed, using planar fallback: %s", e)
         # Fallback: rough approximation (inaccurate but better than crashing)
-        return abs(poly.area) * 111.32 * 111.32  # Rough deg² to km² conversion
+        area_deg2 = _shoelace_area_deg2(np.asarray(poly.exterior.coords))
+        return area_deg2 * KM_PER_DEG * KM_PER_DEG  # Rough deg² to km² conversion
 
 
 # ========== GEOMETRY CONVERSION FUNCTIONS ==========
@@ -251,10 +400,11 @@ def coords_to_bbox(coords: List[schemas.Coordinate]) -> List[float]:
     Returns:
         Bounding box [minx, miny, maxx, maxy]
     """
-    lons = [c.longitude for c in coords]
-    lats = [c.latitude for c in coords]
+    arr = coords_to_array(coords)
+    minx, miny = arr.min(axis=0).tolist()
+    maxx, maxy = arr.max(axis=0).tolist()
     
-    return [min(lons), min(lats), max(lons), max(lats)]
+    return [minx, miny, maxx, maxy]
 
 
 def bbox_to_geojson(bbox: List[float], buffer_deg: float = 0) -> Dict:
@@ -271,28 +421,62 @@ def bbox_to_geojson(bbox: List[float], buffer_deg: float = 0) -> Dict:
     """
     minx, miny, maxx, maxy = bbox
     
-    # Create rectangle polygon from bbox
-    poly = Polygon([
-        (minx, miny),
-        (maxx, miny),
-        (maxx, maxy),
-        (minx, maxy),
-        (minx, miny)  # Close polygon
-    ])
+    ring = [
+        [minx, miny],
+        [maxx, miny],
+        [maxx, maxy],
+        [minx, maxy],
+        [minx, miny]  # Close polygon
+    ]
     
-    # Apply buffer if specified
+    # Apply buffer if specified (needs GEOS)
     if buffer_deg > 0:
-        poly = poly.buffer(buffer_deg)
+        poly = Polygon(ring).buffer(buffer_deg)
+        return {
+            "type": "Feature",
+            "geometry": mapping(poly),
+            "properties": calculate_polygon_properties(poly, buffer_deg)
+        }
+    
+    # Plain rectangle: emit the ring directly and measure it analytically
+    area_m2, perimeter_m = GEOD.polygon_area_perimeter(
+        [minx, maxx, maxx, minx],
+        [miny, miny, maxy, maxy]
+    )
     
     return {
         "type": "Feature",
-        "geometry": mapping(poly),
-        "properties": calculate_polygon_properties(poly, buffer_deg)
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+        "properties": _build_properties(
+            area_m2=area_m2,
+            perimeter_m=perimeter_m,
+            centroid=((minx + maxx) / 2, (miny + maxy) / 2),
+            bounds=(minx, miny, maxx, maxy),
+            num_vertices=len(ring),
+            buffer_applied=buffer_deg
+        )
     }
 
 
 # ========== COORDINATE TRANSFORMATION ==========
 
+@lru_cache(maxsize=64)
+def _get_transformer(from_crs: str, to_crs: str) -> Transformer:
+    """
+    Get a cached (lon, lat)-ordered Transformer for a CRS pair
+    PROJ parses both CRS definitions on construction, which costs far more
+    than transforming a handful of points, so transformers are reused
+    
+    Args:
+        from_crs: Source CRS
+        to_crs: Target CRS
+    
+    Returns:
+        pyproj Transformer with always_xy=True
+    """
+    return Transformer.from_crs(from_crs, to_crs, always_xy=True)
+
+
 def transform_coordinates(
     coords: List[schemas.Coordinate],
     from_crs: str = "EPSG:4326",
@@ -314,15 +498,68 @@ def transform_coordinates(
         >>> coords = [Coordinate(longitude=0, latitude=51.5)]
         >>> transformed = transform_coordinates(coords, "EPSG:4326", "EPSG:3857")
     """
-    transformer = Transformer.from_crs(from_crs, to_crs, always_xy=True)
+    xs, ys = transform_coordinates_array(coords, from_crs, to_crs)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+def transform_coordinates_array(
+    coords: List[schemas.Coordinate],
+    from_crs: str = "EPSG:4326",
+    to_crs: str = "EPSG:3857"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Transform coordinates between CRSs, returning contiguous numpy arrays
+    Preferred over transform_coordinates for numpy consumers (no tuple list)
+    
+    Args:
+        coords: List of Coordinate objects
+        from_crs: Source CRS (default: WGS84)
+        to_crs: Target CRS (default: Web Mercator)
+    
+    Returns:
+        Tuple of (xs, ys) float64 arrays
+    """
+    n = len(coords)
+    lons = np.fromiter((c.longitude for c in coords), dtype=np.float64, count=n)
+    lats = np.fromiter((c.latitude for c in coords), dtype=np.float64, count=n)
+    
+    # One PROJ call for the whole batch instead of one per point
+    xs, ys = _get_transformer(from_crs, to_crs).transform(lons, lats)
+    
+    logger.debug("Transformed %d coordinates from %s to %s", n, from_crs, to_crs)
+    return xs, ys
+
+
+def _project_geometry(geom, transformer: Transformer):
+    """
+    Reproject every vertex of a geometry in one vectorised PROJ call
+    
+    Args:
+        geom: Shapely geometry
+        transformer: pyproj Transformer (always_xy)
     
-    transformed = []
-    for coord in coords:
-        x, y = transformer.transform(coord.longitude, coord.latitude)
-        transformed.append((x, y))
+    Returns:
+        New geometry with projected coordinates
+    """
+    def project(xy: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(xy[:, 0], xy[:, 1]))
     
-    logger.debug(f"Transformed {len(coords)} coordinates from {from_crs} to {to_crs}")
-    return transformed
+    return shapely.transform(geom, project)
+
+
+def _utm_crs(lon: float, lat: float) -> str:
+    """
+    EPSG code of the WGS84 UTM zone containing a point
+    
+    Args:
+        lon: Longitude in degrees
+        lat: Latitude in degrees
+    
+    Returns:
+        CRS string, e.g. "EPSG:32631" (north) or "EPSG:32731" (south)
+    """
+    utm_zone = min(int((lon + 180) // 6) + 1, 60)
+    return f"EPSG:326{utm_zone:02d}" if lat >= 0 else f"EPSG:327{utm_zone:02d}"
 
 
 def add_buffer_meters(poly: Polygon, buffer_meters: float) -> Polygon:
@@ -341,19 +578,14 @@ def add_buffer_meters(poly: Polygon, buffer_meters: float) -> Polygon:
     centroid = poly.centroid
     lon, lat = centroid.x, centroid.y
     
-    # Calculate UTM zone
-    utm_zone = int((lon + 180) / 6) + 1
-    utm_crs = f"EPSG:326{utm_zone}" if lat >= 0 else f"EPSG:327{utm_zone}"
+    utm_crs = _utm_crs(lon, lat)
     
     # Transform to UTM, buffer, transform back
-    project_to_utm = Transformer.from_crs("EPSG:4326", utm_crs, always_xy=True).transform
-    project_to_wgs84 = Transformer.from_crs(utm_crs, "EPSG:4326", always_xy=True).transform
-    
-    poly_utm = transform(project_to_utm, poly)
+    poly_utm = _project_geometry(poly, _get_transformer("EPSG:4326", utm_crs))
     buffered_utm = poly_utm.buffer(buffer_meters)
-    buffered_wgs84 = transform(project_to_wgs84, buffered_utm)
+    buffered_wgs84 = _project_geometry(buffered_utm, _get_transformer(utm_crs, "EPSG:4326"))
     
-    logger.debug(f"Applied {buffer_meters}m buffer using {utm_crs}")
+    logger.debug("Applied %sm buffer using %s", buffer_meters, utm_crs)
     return buffered_wgs84
 
 
@@ -369,11 +601,8 @@ def ensure_counterclockwise(coords: List[schemas.Coordinate]) -> List[schemas.Co
     Returns:
         Reordered coordinates if needed
     """
-    points = [(c.longitude, c.latitude) for c in coords]
-    poly = Polygon(points)
-    
-    # Check orientation using signed area
-    if not poly.exterior.is_ccw:
+    # Check orientation using signed area (no GEOS geometry needed)
+    if _signed_area_deg2(coords_to_array(coords)) < 0:
         logger.debug("Reversing polygon vertex order to counter-clockwise")
         coords = list(reversed(coords))
     
@@ -406,13 +635,61 @@ def simplify_polygon_coords(
     ]
     
     logger.debug(
-        f"Simplified polygon from {len(coords)} to {len(simplified_coords)} vertices "
-        f"(tolerance={tolerance_deg}°)"
+        "Simplified polygon from %d to %d vertices (tolerance=%s°)",
+        len(coords), len(simplified_coords), tolerance_deg
     )
     
     return simplified_coords
 
 
+def simplify_polygon_coords_batch(
+    coords_list: List[List[schemas.Coordinate]],
+    tolerance_deg: float = 0.0001
+) -> List[List[schemas.Coordinate]]:
+    """
+    Simplify many polygons at once (Douglas-Peucker algorithm)
+    Builds all rings in one shapely array call and simplifies them in a single
+    vectorised pass instead of one Python round-trip per polygon
+    
+    Args:
+        coords_list: List of coordinate lists, one per polygon
+        tolerance_deg: Simplification tolerance in degrees (0.0001 ≈ 11m)
+    
+    Returns:
+        List of simplified coordinate lists, in input order
+    """
+    if not coords_list:
+        return []
+    
+    arrays = [coords_to_array(coords) for coords in coords_list]
+    counts = np.fromiter((len(a) for a in arrays), dtype=np.intp, count=len(arrays))
+    
+    # linearrings closes each ring; indices map every vertex to its polygon
+    rings = shapely.linearrings(
+        np.concatenate(arrays),
+        indices=np.repeat(np.arange(len(arrays)), counts)
+    )
+    simplified = shapely.simplify(shapely.polygons(rings), tolerance_deg, preserve_topology=True)
+    
+    # Pull every exterior back out in one call and split per polygon
+    out_coords, out_index = shapely.get_coordinates(
+        shapely.get_exterior_ring(simplified), return_index=True
+    )
+    out_counts = np.bincount(out_index, minlength=len(arrays))
+    
+    simplified_list = [
+        [schemas.Coordinate(longitude=x, latitude=y) for x, y in part.tolist()]
+        for part in np.split(out_coords, np.cumsum(out_counts)[:-1])
+    ]
+    
+    logger.debug(
+        "Simplified %d polygons from %d to %d total vertices (tolerance=%s°)",
+        len(arrays), int(counts.sum()), len(out_coords), tolerance_deg
+    )
+    
+    return simplified_list
+
+
 # ========== EXPORT FUNCTIONS ==========
 
 def geojson_to_string(geojson: Dict, pretty: bool = False) -> str:
@@ -426,10 +703,10 @@ def geojson_to_string(geojson: Dict, pretty: bool = False) -> str:
     Returns:
         JSON string
     """
+    option = orjson.OPT_SERIALIZE_NUMPY
     if pretty:
-        return json.dumps(geojson, indent=2)
-    else:
-        return json.dumps(geojson)
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(geojson, option=option).decode('utf-8')
 
 
 def save_geojson(geojson: Dict, filepath: str):
@@ -440,10 +717,10 @@ def save_geojson(geojson: Dict, filepath: str):
         geojson: GeoJSON Feature dict
         filepath: Output file path
     """
-    with open(filepath, 'w') as f:
-        json.dump(geojson, f, indent=2)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(geojson, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
-    logger.info(f"Saved GeoJSON to {filepath}")
+    logger.info("Saved GeoJSON to %s", filepath)
 
 
 # ========== DEBUGGING HELPERS ==========
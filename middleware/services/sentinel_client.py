@@ -6,14 +6,24 @@ Provides RGB true-color images for visualization in frontend
 
 import asyncio
 import httpx
+import numpy as np
+import orjson
 import base64
+import hashlib
+import math
 import os
+import re
 import time
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from tempfile import SpooledTemporaryFile
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from functools import lru_cache
-from datetime import datetime, timedelta
 import logging
 
+from validators import KM_PER_DEG  # Shared km-per-degree approximation
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,27 +41,137 @@ WMTS_URL = "https://sh.dataspace.copernicus.eu/ogc/wmts/{instance_id}"
 # Request configuration
 REQUEST_TIMEOUT = 60.0  # seconds
 MAX_RETRIES = 3
+RETRY_DELAYS = (1, 2, 4)  # seconds - exponential backoff between attempts
+RETRY_AFTER_MAX = 30.0  # seconds - cap on server-requested Retry-After waits
 DEFAULT_IMAGE_SIZE = 512  # pixels (width and height)
 MAX_CLOUD_COVERAGE = 20  # percentage
+MAX_IMAGE_SIZE = 2048  # pixels - Processing API caps output at 2500px per side
+MAX_BBOX_AREA_KM2 = 100_000  # reject runaway bboxes before any network call
+TOKEN_EXPIRY_BUFFER = 300  # seconds - refresh tokens this long before they expire
+SENTINEL_CONCURRENCY = int(os.getenv("SENTINEL_CONCURRENCY", "8"))  # max in-flight process requests
+
+# Connection pool for the shared HTTP client
+HTTP_MAX_CONNECTIONS = 32
+HTTP_MAX_KEEPALIVE = 16
+HTTP_KEEPALIVE_EXPIRY = 300.0  # seconds
+
+# Output image encoding (visualization only, so lossy JPEG is fine and ~4x smaller than PNG)
+# Sentinel Hub Processing API supports image/jpeg, image/png and image/tiff
+DEFAULT_IMAGE_FORMAT = "image/jpeg"
+JPEG_QUALITY = 85
+
+# Images larger than this are base64-encoded in a worker thread (bytes)
+BASE64_THREAD_THRESHOLD = 256_000
+BASE64_CHUNK_SIZE = 3 * 65536  # multiple of 3 so chunks encode without padding
+
+# Response bodies are streamed into a spooled buffer; larger ones spill to disk
+STREAM_CHUNK_SIZE = 65536  # bytes
+IMAGE_SPOOL_MAX_SIZE = 512 * 1024  # bytes kept in memory before spilling
+
+# Image result cache (Sentinel-2 scenes for a given AOI/date range don't change)
+IMAGE_CACHE_SIZE = 256  # max cached images (LRU eviction)
+IMAGE_CACHE_TTL = 86400  # seconds
+
+
+# ========== HTTP CLIENT ==========
+
+# Shared client so token and process requests reuse pooled keep-alive connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient, creating it on first use
+    Created lazily so it binds to the running event loop rather than import time
+    
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared AsyncClient (called on app shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.debug("Closed Sentinel Hub HTTP client")
+
+
+# Bounds concurrent Processing API requests (created lazily inside the running event loop)
+_request_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting in-flight Sentinel Hub process requests"""
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(SENTINEL_CONCURRENCY)
+    return _request_semaphore
+
+
+# Payload hash -> (monotonic insert time, data URL), kept in LRU order
+_image_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
 
 
 # ========== AUTHENTICATION ==========
 
-@lru_cache(maxsize=1)
-def get_auth_token() -> str:
+# Cached OAuth2 access token and its monotonic expiry time
+_token_state = {"token": None, "expires_at": 0.0}
+_token_lock: Optional[asyncio.Lock] = None
+
+
+def _get_token_lock() -> asyncio.Lock:
+    """Get the token refresh lock (created lazily inside the running event loop)"""
+    global _token_lock
+    if _token_lock is None:
+        _token_lock = asyncio.Lock()
+    return _token_lock
+
+
+async def get_auth_token() -> str:
     """
     Fetch OAuth2 access token from Copernicus Data Space
-    Token is cached for 1 hour (typical expiry time)
+    Token is cached until TOKEN_EXPIRY_BUFFER seconds before its expires_in,
+    and concurrent callers share a single refresh request
     
     Returns:
         Access token string
     
     Raises:
         Exception: If authentication fails
+    """
+    if _token_state["token"] and time.monotonic() < _token_state["expires_at"]:
+        return _token_state["token"]
+    
+    async with _get_token_lock():
+        # Another coroutine may have refreshed while we waited
+        if _token_state["token"] and time.monotonic() < _token_state["expires_at"]:
+            return _token_state["token"]
+        
+        return await _fetch_auth_token()
+
+
+async def _fetch_auth_token() -> str:
+    """
+    Request a new OAuth2 token and store it in the token cache
+    
+    Returns:
+        Access token string
     
-    Note:
-        Token cache is cleared automatically after function call count limit.
-        For production, use a proper cache with TTL (Redis, etc.)
+    Raises:
+        Exception: If authentication fails
     """
     if not CDSE_CLIENT_ID or not CDSE_CLIENT_SECRET:
         raise ValueError(
@@ -62,7 +182,7 @@ def get_auth_token() -> str:
     logger.info("Fetching new OAuth2 token from Copernicus Data Space")
     
     try:
-        response = httpx.post(
+        response = await get_http_client().post(
             TOKEN_URL,
             data={
                 "grant_type": "client_credentials",
@@ -73,27 +193,29 @@ def get_auth_token() -> str:
         )
         response.raise_for_status()
         
-        token_data = response.json()
+        token_data = orjson.loads(response.content)
         access_token = token_data['access_token']
         expires_in = token_data.get('expires_in', 3600)
         
-        logger.info(f"✅ OAuth2 token acquired (expires in {expires_in}s)")
+        logger.info("✅ OAuth2 token acquired (expires in %ss)", expires_in)
+        _token_state["token"] = access_token
+        _token_state["expires_at"] = time.monotonic() + expires_in - TOKEN_EXPIRY_BUFFER
         return access_token
         
     except httpx.HTTPStatusError as e:
-        logger.error(f"Authentication failed: {e.response.status_code} - {e.response.text}")
+        logger.error("Authentication failed: %s - %s", e.response.status_code, e.response.text)
         raise Exception(
             f"Failed to authenticate with Copernicus: {e.response.text}. "
             f"Check your CDSE_CLIENT_ID and CDSE_CLIENT_SECRET."
         )
     except Exception as e:
-        logger.error(f"Token request failed: {e}")
+        logger.error("Token request failed: %s", e)
         raise Exception(f"Failed to fetch authentication token: {str(e)}")
 
 
 def refresh_token_cache():
     """Clear cached token to force refresh on next request"""
-    get_auth_token.cache_clear()
+    _token_state["expires_at"] = 0.0
     logger.debug("Cleared OAuth2 token cache")
 
 
@@ -183,7 +305,8 @@ async def fetch_satellite_image(
     date_range: str = "2025-01-01/2025-12-31",
     image_size: int = DEFAULT_IMAGE_SIZE,
     max_cloud_coverage: int = MAX_CLOUD_COVERAGE,
-    return_format: str = "base64"
+    return_format: str = "base64",
+    image_format: str = DEFAULT_IMAGE_FORMAT
 ) -> str:
     """
     Fetch Sentinel-2 RGB satellite image for polygon
@@ -193,10 +316,11 @@ async def fetch_satellite_image(
         date_range: Date range in format "YYYY-MM-DD/YYYY-MM-DD"
         image_size: Output image size in pixels (width and height)
         max_cloud_coverage: Maximum acceptable cloud coverage percentage (0-100)
-        return_format: "base64" (PNG embedded in JSON) or "url" (tile URL)
+        return_format: "base64" (image embedded in JSON) or "url" (tile URL)
+        image_format: Output MIME type ("image/jpeg" or "image/png")
     
     Returns:
-        Base64-encoded PNG string (data:image/png;base64,...) or tile URL
+        Base64-encoded image string (data:image/jpeg;base64,...) or tile URL
     
     Raises:
         Exception: If image fetch fails
@@ -204,26 +328,17 @@ async def fetch_satellite_image(
     Example:
         >>> geojson = {"type": "Feature", "geometry": {...}}
         >>> img = await fetch_satellite_image(geojson, "2025-07-01/2025-12-31")
-        >>> # Returns: "data:image/png;base64,iVBORw0KGgoAAAANSUhEUg..."
+        >>> # Returns: "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQ..."
     """
-    logger.info(f"Fetching Sentinel-2 image for date range: {date_range}")
-    
-    # Get OAuth token
-    try:
-        token = get_auth_token()
-    except Exception as e:
-        logger.error(f"Token acquisition failed: {e}")
-        raise
+    logger.info("Fetching Sentinel-2 image for date range: %s", date_range)
     
     # Extract bounding box from GeoJSON
     bbox = geojson['properties'].get('bbox')
     if not bbox:
         # Calculate bbox if not provided
-        from shapely.geometry import shape
-        poly = shape(geojson['geometry'])
-        bbox = list(poly.bounds)  # [minx, miny, maxx, maxy]
+        bbox = geometry_bbox(geojson['geometry'])  # [minx, miny, maxx, maxy]
     
-    logger.debug(f"Using bounding box: {bbox}")
+    logger.debug("Using bounding box: %s", bbox)
     
     # Parse date range
     date_from, date_to = parse_date_range(date_range)
@@ -235,34 +350,163 @@ async def fetch_satellite_image(
         date_to=date_to,
         image_size=image_size,
         max_cloud_coverage=max_cloud_coverage,
-        evalscript=RGB_EVALSCRIPT
+        evalscript=RGB_EVALSCRIPT,
+        image_format=image_format
     )
     
+    if return_format != "base64":
+        # For tile URL, would need to use WMTS service (not implemented here)
+        # This requires creating a configuration/instance first
+        logger.warning("Tile URL format not yet implemented, returning base64")
+    
+    # Fetch (or reuse cached) image as base64 data URL for JSON embedding
+    return await fetch_process_image(payload)
+
+
+async def fetch_satellite_images(geojsons: List[Dict], **kwargs) -> List:
+    """
+    Fetch Sentinel-2 RGB images for many polygons concurrently
+    In-flight requests are capped at SENTINEL_CONCURRENCY
+    
+    Args:
+        geojsons: List of GeoJSON Features
+        **kwargs: Passed through to fetch_satellite_image
+    
+    Returns:
+        List in input order of image strings, or the Exception raised for
+        that polygon (one failure does not cancel the rest)
+    """
+    logger.info("Fetching Sentinel-2 images for %d polygons", len(geojsons))
+    return await asyncio.gather(
+        *(fetch_satellite_image(geojson, **kwargs) for geojson in geojsons),
+        return_exceptions=True
+    )
+
+
+# ========== HELPER FUNCTIONS ==========
+
+async def fetch_process_image(payload: Dict) -> str:
+    """
+    Run a Processing API request and return the image as a base64 data URL
+    Results are cached by payload hash (LRU, IMAGE_CACHE_SIZE entries,
+    IMAGE_CACHE_TTL seconds), so repeated AOI/date requests skip both the
+    network round-trip and the base64 encode
+    
+    Args:
+        payload: Request payload from build_process_request
+    
+    Returns:
+        Base64-encoded image data URL (MIME type taken from the payload)
+    
+    Raises:
+        Exception: If token acquisition or image fetch fails
+    """
+    key = _payload_cache_key(payload)
+    image_format = payload["output"]["responses"][0]["format"]["type"]
+    
+    cached = _image_cache.get(key)
+    if cached and time.monotonic() - cached[0] < IMAGE_CACHE_TTL:
+        _image_cache.move_to_end(key)
+        logger.info("✅ Satellite image served from cache")
+        return cached[1]
+    
+    # Get OAuth token
+    try:
+        token = await get_auth_token()
+    except Exception as e:
+        logger.error("Token acquisition failed: %s", e)
+        raise
+    
     # Make request with retries
-    image_bytes = await fetch_with_retry(
+    image_file = await fetch_with_retry(
         url=PROCESS_URL,
         payload=payload,
         token=token,
-        max_retries=MAX_RETRIES
+        max_retries=MAX_RETRIES,
+        accept=image_format
     )
     
-    # Convert to base64 for JSON embedding
-    if return_format == "base64":
-        img_base64 = base64.b64encode(image_bytes).decode('utf-8')
-        result = f"data:image/png;base64,{img_base64}"
-        logger.info(f"✅ Satellite image fetched ({len(image_bytes)} bytes, base64 encoded)")
-    else:
-        # For tile URL, would need to use WMTS service (not implemented here)
-        # This requires creating a configuration/instance first
-        result = None
-        logger.warning("Tile URL format not yet implemented, returning base64")
-        img_base64 = base64.b64encode(image_bytes).decode('utf-8')
-        result = f"data:image/png;base64,{img_base64}"
+    with image_file:
+        size = image_file.seek(0, os.SEEK_END)
+        image_file.seek(0)
+        if size > BASE64_THREAD_THRESHOLD:
+            # Keep the event loop free while multi-MB images are encoded
+            result = await asyncio.to_thread(_file_to_data_url, image_file, image_format)
+        else:
+            result = _to_data_url(image_file.read(), image_format)
+    logger.info("✅ Satellite image fetched (%d bytes, base64 encoded)", size)
+    
+    _image_cache[key] = (time.monotonic(), result)
+    _image_cache.move_to_end(key)
+    while len(_image_cache) > IMAGE_CACHE_SIZE:
+        _image_cache.popitem(last=False)
     
     return result
 
 
-# ========== HELPER FUNCTIONS ==========
+def geometry_bbox(geometry: Dict) -> list:
+    """
+    Bounding box of a GeoJSON Polygon/MultiPolygon straight from its coordinates
+    Only exterior rings are scanned (holes can't extend the bounds)
+    
+    Args:
+        geometry: GeoJSON geometry dict
+    
+    Returns:
+        Bounding box [minx, miny, maxx, maxy]
+    """
+    if geometry['type'] == 'MultiPolygon':
+        rings = [polygon[0] for polygon in geometry['coordinates']]
+    else:
+        rings = [geometry['coordinates'][0]]
+    
+    coords = np.concatenate([np.asarray(ring, dtype=np.float64)[:, :2] for ring in rings])
+    minx, miny = coords.min(axis=0).tolist()
+    maxx, maxy = coords.max(axis=0).tolist()
+    return [minx, miny, maxx, maxy]
+
+
+def _to_data_url(image_bytes: bytes, image_format: str = DEFAULT_IMAGE_FORMAT) -> str:
+    """
+    Encode image bytes as a data URL of the given MIME type
+    base64 output is pure ASCII, so the ascii codec skips UTF-8 validation,
+    and a single concatenation avoids an extra f-string copy
+    """
+    return "data:" + image_format + ";base64," + base64.b64encode(image_bytes).decode('ascii')
+
+
+def _file_to_data_url(image_file, image_format: str = DEFAULT_IMAGE_FORMAT) -> str:
+    """
+    Encode a binary file as a data URL, reading BASE64_CHUNK_SIZE at a time
+    The raw image is never fully loaded, and since b64encode holds the GIL for
+    the whole call, chunking lets the event loop run between pieces when this
+    is called from a worker thread
+    
+    Args:
+        image_file: Binary file object positioned at the start of the image
+        image_format: MIME type for the data URL
+    """
+    encoded = b"".join(
+        iter(lambda: base64.b64encode(image_file.read(BASE64_CHUNK_SIZE)), b"")
+    )
+    return "data:" + image_format + ";base64," + encoded.decode('ascii')
+
+
+def _payload_cache_key(payload: Dict) -> str:
+    """Stable hash of a process request payload (bbox, dates, size, evalscript)"""
+    encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def clear_image_cache():
+    """Drop all cached satellite images"""
+    _image_cache.clear()
+    logger.debug("Cleared satellite image cache")
+
+
+# "YYYY-MM-DD/YYYY-MM-DD"
+_DATE_RANGE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})/(\d{4}-\d{2}-\d{2})$")
+
 
 def parse_date_range(date_range: str) -> Tuple[str, str]:
     """
@@ -279,33 +523,60 @@ def parse_date_range(date_range: str) -> Tuple[str, str]:
         ('2025-07-01T00:00:00Z', '2025-12-31T23:59:59Z')
     """
     try:
-        date_from_str, date_to_str = date_range.split('/')
-        
-        # Validate dates
-        date_from = datetime.strptime(date_from_str, '%Y-%m-%d')
-        date_to = datetime.strptime(date_to_str, '%Y-%m-%d')
+        # Shape check with the precompiled regex, then a cheap calendar check
+        # (fromisoformat rejects e.g. 2024-02-30) on the two captured halves
+        match = _DATE_RANGE_RE.match(date_range)
+        if match is None:
+            raise ValueError("expected YYYY-MM-DD/YYYY-MM-DD")
+        date_from_str, date_to_str = match.group(1), match.group(2)
+        date.fromisoformat(date_from_str)
+        date.fromisoformat(date_to_str)
         
         # Add time components
-        date_from_iso = f"{date_from_str}T00:00:00Z"
-        date_to_iso = f"{date_to_str}T23:59:59Z"
-        
-        return date_from_iso, date_to_iso
+        return date_from_str + "T00:00:00Z", date_to_str + "T23:59:59Z"
         
     except Exception as e:
-        logger.error(f"Invalid date range format: {date_range}")
+        logger.error("Invalid date range format: %s", date_range)
         # Fallback to last 6 months
         date_to = datetime.now()
         date_from = date_to - timedelta(days=180)
         return date_from.isoformat() + "Z", date_to.isoformat() + "Z"
 
 
+# Constant parts of every Processing API payload, built once at import.
+# Shared between payloads, so treat them as read-only.
+_BOUNDS_PROPERTIES = {
+    "crs": "http://www.opengis.net/def/crs/EPSG/0/4326"
+}
+_OUTPUT_RESPONSES = {
+    "image/jpeg": [
+        {
+            "identifier": "default",
+            "format": {
+                "type": "image/jpeg",
+                "quality": JPEG_QUALITY
+            }
+        }
+    ],
+    "image/png": [
+        {
+            "identifier": "default",
+            "format": {
+                "type": "image/png"
+            }
+        }
+    ]
+}
+
+
 def build_process_request(
     bbox: list,
     date_from: str,
     date_to: str,
     image_size: int,
     max_cloud_coverage: int,
-    evalscript: str
+    evalscript: str,
+    image_format: str = DEFAULT_IMAGE_FORMAT
 ) -> Dict:
     """
     Build Sentinel Hub Processing API request payload
@@ -317,17 +588,37 @@ def build_process_request(
         image_size: Output image size in pixels
         max_cloud_coverage: Max cloud coverage percentage
         evalscript: JavaScript evalscript for processing
+        image_format: Output MIME type ("image/jpeg" or "image/png")
     
     Returns:
-        Request payload dictionary
+        Request payload dictionary (constant sub-objects are shared; don't mutate)
+    
+    Raises:
+        ValueError: If image_format is not supported or the bbox is too large
     """
+    # Fail fast: an oversized bbox would only time out after every retry
+    bbox_area_km2 = _bbox_area_km2(bbox)
+    if bbox_area_km2 > MAX_BBOX_AREA_KM2:
+        raise ValueError(
+            f"Bounding box too large for satellite imagery: {bbox_area_km2:.0f} km² "
+            f"exceeds limit of {MAX_BBOX_AREA_KM2} km²"
+        )
+    
+    image_size = min(image_size, MAX_IMAGE_SIZE)
+    
+    responses = _OUTPUT_RESPONSES.get(image_format)
+    if responses is None:
+        raise ValueError(
+            f"Unsupported image format: {image_format}. "
+            f"Expected one of {list(_OUTPUT_RESPONSES)}"
+        )
+    
+    # Only the variable leaves are allocated per call; constant parts are shared
     payload = {
         "input": {
             "bounds": {
                 "bbox": bbox,
-                "properties": {
-                    "crs": "http://www.opengis.net/def/crs/EPSG/0/4326"
-                }
+                "properties": _BOUNDS_PROPERTIES
             },
             "data": [
                 {
@@ -346,14 +637,7 @@ def build_process_request(
         "output": {
             "width": image_size,
             "height": image_size,
-            "responses": [
-                {
-                    "identifier": "default",
-                    "format": {
-                        "type": "image/png"
-                    }
-                }
-            ]
+            "responses": responses
         },
         "evalscript": evalscript
     }
@@ -361,23 +645,45 @@ def build_process_request(
     return payload
 
 
+def _bbox_area_km2(bbox: list) -> float:
+    """
+    Approximate bbox area in km² (equirectangular, scaled at mid-latitude)
+    Accurate enough for a sanity limit, and needs no projection
+    
+    Args:
+        bbox: Bounding box [minx, miny, maxx, maxy]
+    
+    Returns:
+        Area in square kilometers
+    """
+    dx = (bbox[2] - bbox[0]) * KM_PER_DEG * math.cos(math.radians((bbox[1] + bbox[3]) / 2))
+    dy = (bbox[3] - bbox[1]) * KM_PER_DEG
+    return abs(dx * dy)
+
+
 async def fetch_with_retry(
     url: str,
     payload: Dict,
     token: str,
-    max_retries: int = 3
-) -> bytes:
+    max_retries: int = 3,
+    accept: str = DEFAULT_IMAGE_FORMAT
+) -> SpooledTemporaryFile:
     """
     Make HTTP request with exponential backoff retry
+    429 and 5xx responses are retried, waiting for the server's Retry-After
+    when it sends one. The response body is streamed into a SpooledTemporaryFile, so large
+    images spill to disk instead of being held in memory
     
     Args:
         url: API endpoint URL
         payload: Request JSON payload
         token: OAuth2 access token
         max_retries: Maximum retry attempts
+        accept: Expected response MIME type (must match the payload's output format)
     
     Returns:
-        Response content bytes (image data)
+        Spooled file holding the response body (image data), positioned at
+        the start; the caller is responsible for closing it
     
     Raises:
         Exception: If all retries fail
@@ -385,38 +691,46 @@ async def fetch_with_retry(
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
-        "Accept": "image/png"
+        "Accept": accept
     }
     
+    # Serialize once; retries resend the same bytes
+    body = orjson.dumps(payload)
+    
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient() as client:
-                logger.debug(f"Sentinel Hub request attempt {attempt + 1}/{max_retries}")
-                
-                response = await client.post(
+            client = get_http_client()
+            logger.debug("Sentinel Hub request attempt %d/%d", attempt + 1, max_retries)
+            
+            async with _get_request_semaphore():
+                async with client.stream(
+                    "POST",
                     url,
-                    json=payload,
+                    content=body,
                     headers=headers,
                     timeout=REQUEST_TIMEOUT
-                )
-                
-                # Handle 401 (token expired) by refreshing
-                if response.status_code == 401:
-                    logger.warning("Token expired, refreshing...")
-                    refresh_token_cache()
-                    token = get_auth_token()
-                    headers["Authorization"] = f"Bearer {token}"
-                    continue
-                
-                response.raise_for_status()
-                
-                # Success
-                return response.content
+                ) as response:
+                    if not response.is_error:
+                        # Success
+                        return await _spool_response(response)
+                    
+                    # Error bodies are small; load them for the handlers below
+                    await response.aread()
+            
+            # Handle 401 (token expired) by refreshing
+            if response.status_code == 401:
+                logger.warning("Token expired, refreshing...")
+                refresh_token_cache()
+                token = await get_auth_token()
+                headers["Authorization"] = f"Bearer {token}"
+                continue
+            
+            response.raise_for_status()
                 
         except httpx.TimeoutException:
-            logger.warning(f"Request timed out (attempt {attempt + 1}/{max_retries})")
+            logger.warning("Request timed out (attempt %d/%d)", attempt + 1, max_retries)
             if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(_retry_delay(attempt))
                 continue
             else:
                 raise Exception(
@@ -425,17 +739,20 @@ async def fetch_with_retry(
                 )
         
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
+            logger.error("HTTP error %s: %s", e.response.status_code, e.response.text)
             
-            # Don't retry on client errors (except 401)
-            if 400 <= e.response.status_code < 500 and e.response.status_code != 401:
+            # Don't retry on client errors (except 401 and 429 rate limiting)
+            status = e.response.status_code
+            if 400 <= status < 500 and status not in (401, 429):
                 raise Exception(
-                    f"Sentinel Hub request failed: {e.response.status_code} - {e.response.text}"
+                    f"Sentinel Hub request failed: {status} - {e.response.text}"
                 )
             
-            # Retry on server errors
+            # Retry on server errors / throttling
             if attempt < max_retries - 1:
-                await asyncio_sleep(2 ** attempt)
+                delay = _retry_delay(attempt, e.response)
+                logger.info("Retrying Sentinel Hub request in %.1fs", delay)
+                await asyncio.sleep(delay)
                 continue
             else:
                 raise Exception(
@@ -443,9 +760,9 @@ async def fetch_with_retry(
                 )
         
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             if attempt < max_retries - 1:
-                await asyncio_sleep(2 ** attempt)
+                await asyncio.sleep(_retry_delay(attempt))
                 continue
             else:
                 raise Exception(f"Failed to fetch satellite image: {str(e)}")
@@ -453,10 +770,54 @@ async def fetch_with_retry(
     raise Exception("Max retries exceeded")
 
 
-async def asyncio_sleep(seconds: float):
-    """Async sleep helper (avoids blocking event loop)"""
-    import asyncio
-    await asyncio.sleep(seconds)
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Seconds to wait before the next attempt
+    Honors a Retry-After header (delta-seconds or HTTP-date) capped at
+    RETRY_AFTER_MAX, otherwise falls back to the RETRY_DELAYS backoff table
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        response: Failed response, if there was one
+    
+    Returns:
+        Delay in seconds
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), RETRY_AFTER_MAX)
+    
+    return RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+
+
+async def _spool_response(response: httpx.Response) -> SpooledTemporaryFile:
+    """
+    Stream a response body into a spooled temporary file
+    Bodies up to IMAGE_SPOOL_MAX_SIZE stay in memory, larger ones go to disk
+    
+    Args:
+        response: Open streaming response
+    
+    Returns:
+        Spooled file positioned at the start of the body
+    """
+    buf = SpooledTemporaryFile(max_size=IMAGE_SPOOL_MAX_SIZE)
+    try:
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            buf.write(chunk)
+    except BaseException:
+        buf.close()
+        raise
+    buf.seek(0)
+    return buf
 
 
 # ========== ALTERNATIVE: NDVI IMAGE ==========
@@ -464,7 +825,8 @@ async def asyncio_sleep(seconds: float):
 async def fetch_ndvi_image(
     geojson: Dict,
     date_range: str = "2025-01-01/2025-12-31",
-    image_size: int = DEFAULT_IMAGE_SIZE
+    image_size: int = DEFAULT_IMAGE_SIZE,
+    image_format: str = DEFAULT_IMAGE_FORMAT
 ) -> str:
     """
     Fetch false-color NDVI image instead of RGB
@@ -474,13 +836,13 @@ async def fetch_ndvi_image(
         geojson: GeoJSON Feature
         date_range: Date range string
         image_size: Output size
+        image_format: Output MIME type ("image/jpeg" or "image/png")
     
     Returns:
-        Base64-encoded PNG
+        Base64-encoded image data URL
     """
     logger.info("Fetching NDVI false-color image")
     
-    token = get_auth_token()
     bbox = geojson['properties'].get('bbox')
     date_from, date_to = parse_date_range(date_range)
     
@@ -490,13 +852,64 @@ async def fetch_ndvi_image(
         date_to=date_to,
         image_size=image_size,
         max_cloud_coverage=MAX_CLOUD_COVERAGE,
-        evalscript=NDVI_EVALSCRIPT
+        evalscript=NDVI_EVALSCRIPT,
+        image_format=image_format
+    )
+    
+    return await fetch_process_image(payload)
+
+
+async def fetch_rgb_and_ndvi(
+    geojson: Dict,
+    date_range: str = "2025-01-01/2025-12-31",
+    image_size: int = DEFAULT_IMAGE_SIZE,
+    max_cloud_coverage: int = MAX_CLOUD_COVERAGE,
+    image_format: str = DEFAULT_IMAGE_FORMAT
+) -> Tuple[str, str]:
+    """
+    Fetch true-color RGB and NDVI images for the same polygon concurrently
+    bbox and dates are resolved once and both requests share one OAuth token,
+    so wall-clock time is roughly the slower of the two fetches
+    
+    Args:
+        geojson: GeoJSON Feature with polygon geometry
+        date_range: Date range in format "YYYY-MM-DD/YYYY-MM-DD"
+        image_size: Output image size in pixels (width and height)
+        max_cloud_coverage: Maximum acceptable cloud coverage percentage (0-100)
+        image_format: Output MIME type ("image/jpeg" or "image/png")
+    
+    Returns:
+        Tuple of (rgb_data_url, ndvi_data_url)
+    
+    Raises:
+        Exception: If either image fetch fails
+    """
+    logger.info("Fetching Sentinel-2 RGB + NDVI images for date range: %s", date_range)
+    
+    bbox = geojson['properties'].get('bbox') or geometry_bbox(geojson['geometry'])
+    date_from, date_to = parse_date_range(date_range)
+    
+    rgb_payload, ndvi_payload = (
+        build_process_request(
+            bbox=bbox,
+            date_from=date_from,
+            date_to=date_to,
+            image_size=image_size,
+            max_cloud_coverage=max_cloud_coverage,
+            evalscript=evalscript,
+            image_format=image_format
+        )
+        for evalscript in (RGB_EVALSCRIPT, NDVI_EVALSCRIPT)
     )
     
-    image_bytes = await fetch_with_retry(PROCESS_URL, payload, token, MAX_RETRIES)
+    # Warm the token cache up front so both legs reuse the same token
+    await get_auth_token()
     
-    img_base64 = base64.b64encode(image_bytes).decode('utf-8')
-    return f"data:image/png;base64,{img_base64}"
+    rgb, ndvi = await asyncio.gather(
+        fetch_process_image(rgb_payload),
+        fetch_process_image(ndvi_payload)
+    )
+    return rgb, ndvi
 
 
 # ========== HEALTH CHECK ==========
@@ -515,11 +928,11 @@ async def test_sentinel_connection() -> bool:
     logger.info("Testing Sentinel Hub API connection...")
     
     try:
-        token = get_auth_token()
+        await get_auth_token()
         logger.info("✅ Sentinel Hub authentication successful")
         return True
     except Exception as e:
-        logger.error(f"❌ Sentinel Hub connection test failed: {e}")
+        logger.error("❌ Sentinel Hub connection test failed: %s", e)
         raise
 
 
@@ -556,7 +969,13 @@ def get_optimal_date_range(months_back: int = 6) -> str:
     Returns:
         Date range string "YYYY-MM-DD/YYYY-MM-DD"
     """
-    date_to = datetime.now()
+    return _optimal_date_range(date.today().toordinal(), months_back)
+
+
+@lru_cache(maxsize=32)
+def _optimal_date_range(day_ordinal: int, months_back: int) -> str:
+    """Date range string for a given day, computed once per (day, months_back)"""
+    date_to = date.fromordinal(day_ordinal)
     date_from = date_to - timedelta(days=months_back * 30)
     
-    return f"{date_from.strftime('%Y-%m-%d')}/{date_to.strftime('%Y-%m-%d')}"
+    return f"{date_from.isoformat()}/{date_to.isoformat()}"
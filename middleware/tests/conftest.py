@@ -1,8 +1,16 @@
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, Mock
+import httpx
+from unittest.mock import AsyncMock, Mock, patch
+import base64
+import itertools
+import orjson
 import os
 import sys
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
 
 # Add parent directory to Python path so we can import main, schemas, etc.
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -16,246 +24,341 @@ os.environ["ENABLE_AUTH"] = "false"
 os.environ["ENV"] = "test"
 
 # NOW import after path is set and env configured
-from main import app
 import schemas
+import validators
+from services import backend_client, coordinate_parser, sentinel_client
 
 # ========== TEST CLIENT ==========
 
-@pytest.fixture
-def client():
-    """FastAPI test client"""
-    with TestClient(app) as c:
-        yield c
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio, with one event loop for the whole session"""
+    return "asyncio"
+
+@pytest.fixture(scope="session")
+async def aclient(anyio_backend):
+    """
+    Async HTTP client calling the app in-process over ASGI (no thread hop per request)
+    Shared across the session; app startup/shutdown runs once. The app is
+    imported here so runs that never touch the API skip loading it
+    The OpenAPI schema is built once up front; FastAPI memoizes it on the app
+    """
+    from main import app
+    app.openapi()
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(app=app, base_url="http://test") as c:
+            yield c
 
 # ========== COORDINATE FIXTURES ==========
+# Coordinate fixtures are built once per module and returned as tuples, so
+# they are read-only; copy with list(...) if a test needs to modify one.
+# (The validators never mutate their input: validate_polygon_closed returns
+# a new sequence when it has to append the closing point.)
+# valid_coordinates and the request payloads built from it are session-scoped.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_coordinates():
     """Valid polygon coordinates (London area)"""
-    return [
+    return (
         schemas.Coordinate(longitude=0.28, latitude=51.50),
         schemas.Coordinate(longitude=0.19, latitude=51.50),
         schemas.Coordinate(longitude=0.39, latitude=51.52),
         schemas.Coordinate(longitude=0.28, latitude=51.52),
         schemas.Coordinate(longitude=0.28, latitude=51.50)  # Closed
-    ]
+    )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_coordinates_open():
     """Valid polygon coordinates (not closed)"""
-    return [
+    return (
         schemas.Coordinate(longitude=0.28, latitude=51.50),
         schemas.Coordinate(longitude=0.19, latitude=51.50),
         schemas.Coordinate(longitude=0.39, latitude=51.52),
         schemas.Coordinate(longitude=0.28, latitude=51.52)
-    ]
+    )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def small_valid_coordinates():
     """Small valid polygon (just above minimum area)"""
-    return [
+    return (
         schemas.Coordinate(longitude=0.0, latitude=0.0),
         schemas.Coordinate(longitude=0.015, latitude=0.0),
         schemas.Coordinate(longitude=0.015, latitude=0.015),
         schemas.Coordinate(longitude=0.0, latitude=0.015),
         schemas.Coordinate(longitude=0.0, latitude=0.0)
-    ]
+    )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def invalid_coordinates_too_few():
     """Invalid: only 2 points"""
-    return [
+    return (
         schemas.Coordinate(longitude=0.0, latitude=0.0),
         schemas.Coordinate(longitude=1.0, latitude=1.0)
-    ]
+    )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def invalid_coordinates_out_of_range():
     """Invalid: longitude out of range"""
-    return [
+    return (
         schemas.Coordinate(longitude=200.0, latitude=0.0),
         schemas.Coordinate(longitude=0.0, latitude=0.0),
         schemas.Coordinate(longitude=1.0, latitude=1.0),
         schemas.Coordinate(longitude=200.0, latitude=0.0)
-    ]
+    )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def invalid_coordinates_self_intersecting():
     """Invalid: self-intersecting polygon (bow-tie)"""
-    return [
+    return (
         schemas.Coordinate(longitude=0.0, latitude=0.0),
         schemas.Coordinate(longitude=1.0, latitude=1.0),
         schemas.Coordinate(longitude=1.0, latitude=0.0),
         schemas.Coordinate(longitude=0.0, latitude=1.0),
         schemas.Coordinate(longitude=0.0, latitude=0.0)
-    ]
+    )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def invalid_coordinates_collinear():
     """Invalid: all points on same line (no area)"""
-    return [
+    return (
         schemas.Coordinate(longitude=0.0, latitude=0.0),
         schemas.Coordinate(longitude=1.0, latitude=1.0),
         schemas.Coordinate(longitude=2.0, latitude=2.0),
         schemas.Coordinate(longitude=0.0, latitude=0.0)
-    ]
+    )
+
+# ========== POLYGON FIXTURES ==========
+# Shapely geometries are immutable, so each canonical shape is built once
+# per session and shared
+
+@pytest.fixture(scope="session")
+def valid_coordinates_array(valid_coordinates):
+    """valid_coordinates as a read-only (N, 2) float64 [lon, lat] array"""
+    arr = np.asarray(valid_coordinates, dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
+@pytest.fixture(scope="session")
+def valid_coordinates_poly(valid_coordinates_array):
+    """Shapely Polygon built from valid_coordinates"""
+    return Polygon(valid_coordinates_array)
+
+# Canonical test rings, built into Polygons with one vectorized GEOS call
+_SHAPE_RINGS = {
+    "square": [(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)],  # 1° x 1°, aspect ratio 1
+    "rectangle": [(0, 0), (10, 0), (10, 1), (0, 1), (0, 0)],  # 10° x 1°, aspect ratio 10
+    "sliver": [(0, 0), (200, 0), (200, 0.1), (0, 0.1), (0, 0)],  # 200° x 0.1°, aspect ratio 2000
+    "small": [(0, 0), (0.01, 0), (0.01, 0.01), (0, 0.01), (0, 0)],  # ~1.2 km², above minimum
+    "tiny": [(0, 0), (0.0001, 0), (0.0001, 0.0001), (0, 0)],  # below minimum area
+    "large": [(0, 0), (2, 0), (2, 2), (0, 2), (0, 0)],  # 2° x 2°, above maximum area
+}
+SHAPES = dict(zip(
+    _SHAPE_RINGS,
+    shapely.polygons(shapely.linearrings(
+        np.concatenate([np.asarray(ring, dtype=np.float64) for ring in _SHAPE_RINGS.values()]),
+        indices=np.repeat(np.arange(len(_SHAPE_RINGS)), [len(ring) for ring in _SHAPE_RINGS.values()])
+    ))
+))
+
+@pytest.fixture(scope="session")
+def square_polygon():
+    """1° x 1° square at the origin (aspect ratio 1)"""
+    return SHAPES["square"]
+
+@pytest.fixture(scope="session")
+def rectangle_polygon():
+    """10° x 1° rectangle (aspect ratio 10)"""
+    return SHAPES["rectangle"]
+
+@pytest.fixture(scope="session")
+def sliver_polygon():
+    """200° x 0.1° thin sliver (aspect ratio 2000)"""
+    return SHAPES["sliver"]
+
+@pytest.fixture(scope="session")
+def small_polygon():
+    """0.01° square at the origin (~1.2 km², above the minimum area)"""
+    return SHAPES["small"]
+
+@pytest.fixture(scope="session")
+def tiny_polygon():
+    """0.0001° triangle (below the minimum area)"""
+    return SHAPES["tiny"]
+
+@pytest.fixture(scope="session")
+def large_polygon():
+    """2° x 2° square (above the maximum area)"""
+    return SHAPES["large"]
 
 # ========== REQUEST PAYLOAD FIXTURES ==========
 
-@pytest.fixture
-def valid_request_payload(valid_coordinates):
-    """Valid complete RUSLE request payload"""
-    return {
-        "coordinates": [c.dict() for c in valid_coordinates],
-        "options": {
+@pytest.fixture(scope="session")
+def valid_coordinates_json(valid_coordinates):
+    """valid_coordinates serialized once as JSON-ready dicts"""
+    return [c.model_dump(mode='json') for c in valid_coordinates]
+
+@pytest.fixture(scope="session")
+def valid_request_payload(valid_coordinates_json):
+    """Valid complete RUSLE request payload (read-only; dict(...) to modify)"""
+    return MappingProxyType({
+        "coordinates": valid_coordinates_json,
+        "options": MappingProxyType({
             "p_toggle": False,
             "threshold_t_ha_yr": 20.0,
             "compute_sensitivities": True,
             "date_range": "2025-01-01/2025-12-31"
-        }
-    }
+        })
+    })
 
-@pytest.fixture
-def minimal_request_payload(valid_coordinates):
-    """Minimal request (coordinates only, default options)"""
-    return {
-        "coordinates": [c.dict() for c in valid_coordinates]
-    }
+@pytest.fixture(scope="session")
+def valid_request_body(valid_request_payload):
+    """valid_request_payload pre-serialized to JSON bytes (send with content=)"""
+    return orjson.dumps(valid_request_payload, default=dict)
+
+@pytest.fixture(scope="session")
+def minimal_request_payload(valid_coordinates_json):
+    """Minimal request (coordinates only, default options; read-only)"""
+    return MappingProxyType({
+        "coordinates": valid_coordinates_json
+    })
 
 # ========== MOCK SERVICE RESPONSES ==========
+# Response dicts are built once at import and handed out as read-only
+# MappingProxyType views; use dict(...) for a mutable copy.
 
-@pytest.fixture
-def mock_backend_response():
-    """Mock response from backend RUSLE/ML service"""
-    return {
-        "erosion": {
-            "mean": 12.4,
-            "max": 45.2,
-            "min": 0.3,
-            "stddev": 8.7,
-            "p50": 9.1,
-            "p95": 28.3,
-            "p99": 38.5,
-            "unit": "t/ha/yr"
+_MOCK_BACKEND_RESPONSE = {
+    "erosion": {
+        "mean": 12.4,
+        "max": 45.2,
+        "min": 0.3,
+        "stddev": 8.7,
+        "p50": 9.1,
+        "p95": 28.3,
+        "p99": 38.5,
+        "unit": "t/ha/yr"
+    },
+    "factors": {
+        "R": {
+            "mean": 1850.5,
+            "stddev": 120.3,
+            "min": 1620.0,
+            "max": 2100.0,
+            "unit": "MJ mm ha⁻¹ h⁻¹ yr⁻¹",
+            "source": "CHIRPS"
         },
-        "factors": {
-            "R": {
-                "mean": 1850.5,
-                "stddev": 120.3,
-                "min": 1620.0,
-                "max": 2100.0,
-                "unit": "MJ mm ha⁻¹ h⁻¹ yr⁻¹",
-                "source": "CHIRPS"
-            },
-            "K": {
-                "mean": 0.028,
-                "stddev": 0.005,
-                "min": 0.020,
-                "max": 0.035,
-                "unit": "t ha h ha⁻¹ MJ⁻¹ mm⁻¹",
-                "source": "SoilGrids"
-            },
-            "LS": {
-                "mean": 4.2,
-                "stddev": 2.1,
-                "min": 0.5,
-                "max": 12.8,
-                "unit": "dimensionless",
-                "source": "SRTM 30m"
-            },
-            "C": {
-                "mean": 0.08,
-                "stddev": 0.04,
-                "min": 0.01,
-                "max": 0.25,
-                "unit": "dimensionless",
-                "source": "ESA WorldCover + Sentinel-2 NDVI"
-            },
-            "P": {
-                "mean": 1.0,
-                "stddev": 0.0,
-                "min": 1.0,
-                "max": 1.0,
-                "unit": "dimensionless",
-                "source": "User configuration"
-            }
+        "K": {
+            "mean": 0.028,
+            "stddev": 0.005,
+            "min": 0.020,
+            "max": 0.035,
+            "unit": "t ha h ha⁻¹ MJ⁻¹ mm⁻¹",
+            "source": "SoilGrids"
         },
-        "validation": {
-            "high_veg_reduction_pct": 68.2,
-            "flat_terrain_reduction_pct": 85.1,
-            "bare_soil_increase_pct": 230.5,
-            "model_valid": True,
-            "notes": "All sanity checks passed"
+        "LS": {
+            "mean": 4.2,
+            "stddev": 2.1,
+            "min": 0.5,
+            "max": 12.8,
+            "unit": "dimensionless",
+            "source": "SRTM 30m"
         },
-        "hotspots": [
-            {
-                "id": "hotspot_1",
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [[[0.25, 51.51], [0.26, 51.51], [0.26, 51.52], [0.25, 51.52], [0.25, 51.51]]]
-                },
-                "properties": {
-                    "area_ha": 3.2,
-                    "mean_erosion": 38.5,
-                    "max_erosion": 52.1,
-                    "dominant_factor": "LS"
-                },
-                "reason": "Steep slope (LS > 10) + Low vegetation cover (C > 0.15)",
-                "severity": "high",
-                "confidence": 0.89
-            }
-        ],
-        "summary": {
-            "total_hotspots": 1,
-            "total_high_risk_area_ha": 3.2,
-            "severity_distribution": {
-                "low": 0,
-                "moderate": 0,
-                "high": 1,
-                "critical": 0
+        "C": {
+            "mean": 0.08,
+            "stddev": 0.04,
+            "min": 0.01,
+            "max": 0.25,
+            "unit": "dimensionless",
+            "source": "ESA WorldCover + Sentinel-2 NDVI"
+        },
+        "P": {
+            "mean": 1.0,
+            "stddev": 0.0,
+            "min": 1.0,
+            "max": 1.0,
+            "unit": "dimensionless",
+            "source": "User configuration"
+        }
+    },
+    "validation": {
+        "high_veg_reduction_pct": 68.2,
+        "flat_terrain_reduction_pct": 85.1,
+        "bare_soil_increase_pct": 230.5,
+        "model_valid": True,
+        "notes": "All sanity checks passed"
+    },
+    "hotspots": [
+        {
+            "id": "hotspot_1",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0.25, 51.51], [0.26, 51.51], [0.26, 51.52], [0.25, 51.52], [0.25, 51.51]]]
             },
-            "dominant_factors": ["LS", "C"]
+            "properties": {
+                "area_ha": 3.2,
+                "mean_erosion": 38.5,
+                "max_erosion": 52.1,
+                "dominant_factor": "LS"
+            },
+            "reason": "Steep slope (LS > 10) + Low vegetation cover (C > 0.15)",
+            "severity": "high",
+            "confidence": 0.89
+        }
+    ],
+    "summary": {
+        "total_hotspots": 1,
+        "total_high_risk_area_ha": 3.2,
+        "severity_distribution": {
+            "low": 0,
+            "moderate": 0,
+            "high": 1,
+            "critical": 0
         },
-        "tile_urls": {
-            "erosion_risk": "https://earthengine.googleapis.com/v1/test/tiles",
-            "factors": {
-                "R": "https://earthengine.googleapis.com/v1/test/tiles/R",
-                "LS": "https://earthengine.googleapis.com/v1/test/tiles/LS"
-            }
+        "dominant_factors": ["LS", "C"]
+    },
+    "tile_urls": {
+        "erosion_risk": "https://earthengine.googleapis.com/v1/test/tiles",
+        "factors": {
+            "R": "https://earthengine.googleapis.com/v1/test/tiles/R",
+            "LS": "https://earthengine.googleapis.com/v1/test/tiles/LS"
         }
     }
+}
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_backend_response():
+    """
+    Mock response from backend RUSLE/ML service
+    Sections main.py turns into response models are validated through those
+    models once per session (fixture drift fails here, not mid-request) and
+    handed out as their canonical model_dump() form
+    """
+    raw = _MOCK_BACKEND_RESPONSE
+    return MappingProxyType({
+        **raw,
+        "erosion": schemas.ErosionStats.model_validate(raw["erosion"]).model_dump(),
+        "factors": {
+            name: schemas.FactorStats.model_validate(factor).model_dump()
+            for name, factor in raw["factors"].items()
+        },
+        "validation": schemas.ValidationMetrics.model_validate(raw["validation"]).model_dump(),
+        "hotspots": [
+            schemas.Hotspot.model_validate(hotspot).model_dump()
+            for hotspot in raw["hotspots"]
+        ],
+    })
+
+@pytest.fixture(scope="session")
 def mock_satellite_image():
     """Mock base64 satellite image response"""
     return "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
 
-@pytest.fixture
-def mock_geojson():
-    """Mock GeoJSON polygon"""
-    return {
-        "type": "Feature",
-        "geometry": {
-            "type": "Polygon",
-            "coordinates": [[[0.28, 51.50], [0.19, 51.50], [0.39, 51.52], [0.28, 51.52], [0.28, 51.50]]]
-        },
-        "properties": {
-            "area_km2": 25.34,
-            "area_hectares": 2534.0,
-            "centroid": [0.29, 51.51],
-            "bbox": [0.19, 51.50, 0.39, 51.52],
-            "num_vertices": 5,
-            "perimeter_km": 22.5
-        }
-    }
-
-# ========== VALIDATION METADATA FIXTURES ==========
-
-@pytest.fixture
-def mock_validation_metadata():
-    """Mock polygon validation metadata"""
-    return {
-        "valid": True,
+_MOCK_GEOJSON = {
+    "type": "Feature",
+    "geometry": {
+        "type": "Polygon",
+        "coordinates": [[[0.28, 51.50], [0.19, 51.50], [0.39, 51.52], [0.28, 51.52], [0.28, 51.50]]]
+    },
+    "properties": {
         "area_km2": 25.34,
         "area_hectares": 2534.0,
         "centroid": [0.29, 51.51],
@@ -263,45 +366,163 @@ def mock_validation_metadata():
         "num_vertices": 5,
         "perimeter_km": 22.5
     }
+}
+
+@pytest.fixture(scope="session")
+def mock_geojson():
+    """Mock GeoJSON polygon"""
+    return MappingProxyType(_MOCK_GEOJSON)
+
+# ========== VALIDATION METADATA FIXTURES ==========
+
+_MOCK_VALIDATION_METADATA = {
+    "valid": True,
+    "area_km2": 25.34,
+    "area_hectares": 2534.0,
+    "centroid": [0.29, 51.51],
+    "bbox": [0.19, 51.50, 0.39, 51.52],
+    "num_vertices": 5,
+    "perimeter_km": 22.5
+}
+
+@pytest.fixture(scope="session")
+def mock_validation_metadata():
+    """Mock polygon validation metadata"""
+    return MappingProxyType(_MOCK_VALIDATION_METADATA)
 
 # ========== MOCK ASYNC FUNCTIONS ==========
 
+class SentinelHubStub:
+    """
+    In-process stand-in for the Sentinel Hub OAuth and Processing APIs
+    Served through httpx.MockTransport, so the real sentinel_client code
+    (token cache, payload building, retries, base64 encoding) runs without network
+    """
+    
+    def __init__(self, image_bytes: bytes):
+        self.image_bytes = image_bytes
+        self.data_url = "data:image/jpeg;base64," + base64.b64encode(image_bytes).decode('ascii')
+        self.error = None  # exception to raise instead of answering process requests
+        self.process_requests = []  # parsed Processing API payloads, in call order
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/token"):
+            return httpx.Response(200, json={"access_token": "test-token", "expires_in": 3600})
+        self.process_requests.append(orjson.loads(request.content))
+        if self.error is not None:
+            raise self.error
+        return httpx.Response(200, content=self.image_bytes)
+
+@pytest.fixture(scope="class")
+async def _class_mocked_services(anyio_backend, mock_backend_response, mock_satellite_image):
+    """
+    Enter the service patches once per test class
+    Use mocked_services, which resets this state before every test
+    The stub-backed Sentinel client is closed when the class finishes
+    """
+    sentinel = SentinelHubStub(base64.b64decode(mock_satellite_image.split(",", 1)[1]))
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(sentinel)) as sentinel_http:
+        with patch.object(validators, 'validate_full_polygon') as validator, \
+             patch.object(coordinate_parser, 'parse_to_geojson', wraps=coordinate_parser.parse_to_geojson) as parser, \
+             patch.object(backend_client, 'call_backend_rusle', new_callable=AsyncMock) as backend, \
+             patch.object(sentinel_client, '_http_client', sentinel_http), \
+             patch.object(sentinel_client, 'RETRY_DELAYS', (0,)):
+            yield SimpleNamespace(validator=validator, parser=parser, backend=backend, sentinel=sentinel)
+
 @pytest.fixture
-def mock_async_backend_call(mock_backend_response):
-    """AsyncMock for backend_client.call_backend_rusle"""
-    mock = AsyncMock(return_value=mock_backend_response)
-    return mock
+def mocked_services(_class_mocked_services, mock_backend_response):
+    """
+    Patch validator and backend with happy-path returns, and serve Sentinel
+    Hub from a SentinelHubStub at the HTTP transport layer
+    The patches are entered once per class; each test starts from reset
+    mocks, an empty stub and cold sentinel caches
+    The coordinate parser is wrapped, not replaced: it runs for real (its
+    results are lru-cached) unless a test sets parser.side_effect
+    Tests override return_value/side_effect (or sentinel.error) on the
+    attribute they care about
+    """
+    services = _class_mocked_services
+    for mock in (services.validator, services.parser, services.backend):
+        mock.reset_mock(return_value=True, side_effect=True)
+    services.validator.return_value = {"valid": True, "area_km2": 25.3, "num_vertices": 4}
+    services.backend.return_value = mock_backend_response
+    services.sentinel.error = None
+    services.sentinel.process_requests.clear()
+    sentinel_client.clear_image_cache()
+    sentinel_client.refresh_token_cache()
+    
+    yield services
+    
+    sentinel_client.clear_image_cache()
+    sentinel_client.refresh_token_cache()
+
+# ========== FROZEN TIME ==========
+
+FROZEN_NOW = datetime(2025, 1, 1)
+CLOCK_STEP = 0.5  # seconds main's clock advances per time.time() call
+
+class _FrozenDatetime(datetime):
+    """datetime whose utcnow() is pinned to FROZEN_NOW"""
+    @classmethod
+    def utcnow(cls):
+        return FROZEN_NOW
 
 @pytest.fixture
-def mock_async_sentinel_call(mock_satellite_image):
-    """AsyncMock for sentinel_client.fetch_satellite_image"""
-    mock = AsyncMock(return_value=mock_satellite_image)
-    return mock
+def frozen_clock():
+    """
+    Make API timing fields deterministic
+    main's time.time() advances CLOCK_STEP per call, so a request's
+    computation_time_sec is exactly CLOCK_STEP, and response timestamps
+    (schemas datetime.utcnow()) are FROZEN_NOW
+    """
+    import main
+    ticks = itertools.count(FROZEN_NOW.timestamp(), CLOCK_STEP)
+    with patch.object(main, 'time', SimpleNamespace(time=lambda: next(ticks))), \
+         patch.object(schemas, 'datetime', _FrozenDatetime):
+        yield SimpleNamespace(now=FROZEN_NOW, step=CLOCK_STEP)
 
 # ========== ERROR RESPONSE FIXTURES ==========
 
-@pytest.fixture
+_BACKEND_TIMEOUT_RESPONSE = {
+    "error": "TimeoutError",
+    "detail": "Backend computation timed out after 120s"
+}
+
+@pytest.fixture(scope="session")
 def backend_timeout_response():
     """Mock backend timeout error"""
-    return {
-        "error": "TimeoutError",
-        "detail": "Backend computation timed out after 120s"
-    }
+    return MappingProxyType(_BACKEND_TIMEOUT_RESPONSE)
 
-@pytest.fixture
+_BACKEND_ERROR_RESPONSE = {
+    "error": "BackendError",
+    "detail": "RUSLE service error (500): Internal computation failed"
+}
+
+@pytest.fixture(scope="session")
 def backend_error_response():
     """Mock backend service error"""
-    return {
-        "error": "BackendError",
-        "detail": "RUSLE service error (500): Internal computation failed"
-    }
+    return MappingProxyType(_BACKEND_ERROR_RESPONSE)
 
 # ========== PYTEST CONFIGURATION ==========
+# Tests only share read-only fixtures, so the suite can run in parallel with
+# pytest-xdist (each worker builds its own app and session fixtures):
+#   pytest -n auto --dist=loadgroup -m "not serial"
+#   pytest -m serial
+# Mark tests that mutate module globals (caches, os.environ, app state)
+# with @pytest.mark.serial so the parallel job skips them.
+# Full-pipeline validator tests on large polygons are pinned to one
+# xdist_group, so loadgroup runs them on a single worker while the cheap
+# unit tests spread across the rest.
+# Broader end-to-end scenarios are marked integration; a quick PR loop can
+# run only the unit tier and leave the rest to full runs:
+#   pytest -m "not integration"
+#   pytest -m integration
 
 def pytest_configure(config):
     """Configure pytest"""
     config.addinivalue_line(
-        "markers", "integration: mark test as integration test requiring external services"
+        "markers", "integration: mark test as a broader end-to-end scenario (full mocked pipeline)"
     )
     config.addinivalue_line(
         "markers", "slow: mark test as slow running"
@@ -309,10 +530,20 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "unit: mark test as unit test"
     )
+    config.addinivalue_line(
+        "markers", "serial: mark test as mutating shared state (run outside xdist workers)"
+    )
+    # Registered by pytest-xdist when installed; declared here so runs without it stay warning-free
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing a group name on the same xdist worker"
+    )
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_environment():
-    """Reset environment variables after each test"""
+    """
+    Reset environment variables after the test
+    Opt-in: use @pytest.mark.usefixtures("reset_environment") on tests that set env vars
+    """
     original_env = os.environ.copy()
     yield
     os.environ.clear()
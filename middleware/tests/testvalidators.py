@@ -4,6 +4,8 @@ Tests all validation logic, edge cases, and error conditions
 """
 
 import pytest
+import re
+import numpy as np
 from validators import (
     validate_full_polygon,
     validate_coordinate_range,
@@ -16,13 +18,38 @@ from validators import (
     calculate_geodesic_area,
     check_duplicate_points,
     get_polygon_metadata,
+    simplify_polygon,
     PolygonValidationError
 )
 import schemas
+from pydantic import TypeAdapter
 from shapely.geometry import Polygon
+from typing import List
 from unittest.mock import patch, AsyncMock
 
 
+# Expected PolygonValidationError messages, compiled once for pytest.raises(match=...)
+_RX = {
+    "lon_range": re.compile(r"Longitude.*out of valid range"),
+    "lat_range": re.compile(r"Latitude.*out of valid range"),
+    "min_verts": re.compile(r"at least 3 vertices"),
+    "too_complex": re.compile(r"too complex"),
+    "too_small": re.compile(r"too small"),
+    "too_large": re.compile(r"too large"),
+    "aspect": re.compile(r"aspect ratio too extreme"),
+    "no_area": re.compile(r"no area"),
+    "invalid": re.compile(r"Invalid polygon"),
+}
+
+# Validates a whole coordinate list in one pydantic-core call
+_COORD_LIST_ADAPTER = TypeAdapter(List[schemas.Coordinate])
+
+def make_coords(pairs) -> List[schemas.Coordinate]:
+    """Build a list of Coordinates from (lon, lat) pairs"""
+    return _COORD_LIST_ADAPTER.validate_python(
+        [{"longitude": lon, "latitude": lat} for lon, lat in pairs]
+    )
+
 
 # ========== COORDINATE RANGE VALIDATION ==========
 
@@ -33,54 +60,31 @@ class TestCoordinateRange:
         """Test valid coordinate ranges"""
         assert validate_coordinate_range(valid_coordinates) is True
     
-    def test_longitude_too_high(self):
-        """Test longitude > 180"""
-        coords = [
-            schemas.Coordinate(longitude=200, latitude=0),
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=0, latitude=1)
-        ]
-        with pytest.raises(PolygonValidationError, match="Longitude.*out of valid range"):
-            validate_coordinate_range(coords)
-    
-    def test_longitude_too_low(self):
-        """Test longitude < -180"""
-        coords = [
-            schemas.Coordinate(longitude=-200, latitude=0),
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=0, latitude=1)
-        ]
-        with pytest.raises(PolygonValidationError, match="Longitude"):
-            validate_coordinate_range(coords)
-    
-    def test_latitude_too_high(self):
-        """Test latitude > 90"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=100),
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0)
-        ]
-        with pytest.raises(PolygonValidationError, match="Latitude.*out of valid range"):
-            validate_coordinate_range(coords)
-    
-    def test_latitude_too_low(self):
-        """Test latitude < -90"""
+    @pytest.mark.parametrize("lon,lat,match", [
+        pytest.param(200, 0, _RX["lon_range"], id="longitude_too_high"),
+        pytest.param(-200, 0, _RX["lon_range"], id="longitude_too_low"),
+        pytest.param(0, 100, _RX["lat_range"], id="latitude_too_high"),
+        pytest.param(0, -100, _RX["lat_range"], id="latitude_too_low"),
+    ])
+    def test_out_of_range(self, lon, lat, match):
+        """Test longitude outside [-180, 180] / latitude outside [-90, 90]"""
+        # model_construct skips Pydantic validation; the validator under test does the checking
         coords = [
-            schemas.Coordinate(longitude=0, latitude=-100),
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0)
+            schemas.Coordinate.model_construct(longitude=lon, latitude=lat),
+            schemas.Coordinate.model_construct(longitude=0, latitude=0),
+            schemas.Coordinate.model_construct(longitude=1, latitude=1)
         ]
-        with pytest.raises(PolygonValidationError, match="Latitude"):
+        with pytest.raises(PolygonValidationError, match=match):
             validate_coordinate_range(coords)
     
     def test_edge_coordinates(self):
         """Test coordinates at valid boundaries"""
-        coords = [
-            schemas.Coordinate(longitude=180, latitude=90),
-            schemas.Coordinate(longitude=-180, latitude=-90),
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=180, latitude=90)
-        ]
+        coords = make_coords([
+            (180, 90),
+            (-180, -90),
+            (0, 0),
+            (180, 90)
+        ])
         assert validate_coordinate_range(coords) is True
 
 
@@ -91,34 +95,34 @@ class TestMinimumPoints:
     
     def test_valid_triangle(self):
         """Test 3 points (minimum for polygon)"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0),
-            schemas.Coordinate(longitude=0, latitude=1)
-        ]
+        coords = make_coords([
+            (0, 0),
+            (1, 0),
+            (0, 1)
+        ])
         assert validate_minimum_points(coords) is True
     
     def test_too_few_points(self):
         """Test < 3 points"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=1)
-        ]
-        with pytest.raises(PolygonValidationError, match="at least 3 vertices"):
+        coords = make_coords([
+            (0, 0),
+            (1, 1)
+        ])
+        with pytest.raises(PolygonValidationError, match=_RX["min_verts"]):
             validate_minimum_points(coords)
     
     def test_one_point(self):
         """Test single point"""
-        coords = [schemas.Coordinate(longitude=0, latitude=0)]
+        coords = make_coords([(0, 0)])
         with pytest.raises(PolygonValidationError):
             validate_minimum_points(coords)
     
     def test_many_points(self):
         """Test polygon with many vertices"""
-        coords = [
-            schemas.Coordinate(longitude=i*0.1, latitude=i*0.1)
+        coords = make_coords([
+            (i*0.1, i*0.1)
             for i in range(100)
-        ]
+        ])
         assert validate_minimum_points(coords) is True
 
 
@@ -134,12 +138,12 @@ class TestPolygonClosing:
     
     def test_auto_close_open_polygon(self):
         """Test auto-closing of open polygon"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=1)
+        coords = make_coords([
+            (0, 0),
+            (1, 0),
+            (1, 1)
             # Not closed
-        ]
+        ])
         result = validate_polygon_closed(coords)
         assert len(result) == 4  # Should append first point
         assert result[0].longitude == result[-1].longitude
@@ -158,41 +162,67 @@ class TestPolygonGeometry:
         assert poly.is_valid
         assert not poly.is_empty
     
+    def test_valid_polygon_from_array(self, valid_coordinates, valid_coordinates_array):
+        """Test the (N, 2) array input path builds the same polygon"""
+        poly = validate_polygon_geometry(valid_coordinates_array)
+        assert poly.equals(validate_polygon_geometry(valid_coordinates))
+    
     def test_self_intersecting_polygon(self):
         """Test self-intersecting polygon fails"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=1),
-            schemas.Coordinate(longitude=1, latitude=0),
-            schemas.Coordinate(longitude=0, latitude=1),  # Crosses previous edge
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
-        with pytest.raises(PolygonValidationError, match="Invalid polygon"):
+        coords = make_coords([
+            (0, 0),
+            (1, 1),
+            (1, 0),
+            (0, 1),  # Crosses previous edge
+            (0, 0)
+        ])
+        with pytest.raises(PolygonValidationError, match=_RX["invalid"]):
             validate_polygon_geometry(coords)
     
     def test_collinear_points(self):
         """Test collinear points (no area)"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=1),
-            schemas.Coordinate(longitude=2, latitude=2),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
-        with pytest.raises(PolygonValidationError, match="no area"):
+        coords = make_coords([
+            (0, 0),
+            (1, 1),
+            (2, 2),
+            (0, 0)
+        ])
+        with pytest.raises(PolygonValidationError, match=_RX["no_area"]):
             validate_polygon_geometry(coords)
     
     def test_duplicate_consecutive_points(self):
         """Test duplicate consecutive points"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0),  # Duplicate
-            schemas.Coordinate(longitude=1, latitude=1),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
+        coords = make_coords([
+            (0, 0),
+            (1, 0),
+            (1, 0),  # Duplicate
+            (1, 1),
+            (0, 0)
+        ])
         # Should still create valid polygon (Shapely handles duplicates)
         poly = validate_polygon_geometry(coords)
         assert poly.is_valid
+    
+    def test_repair_warns_about_discarded_pieces(self, valid_coordinates, caplog):
+        """Test pieces dropped by the self-intersection repair are reported"""
+        with caplog.at_level("WARNING", logger="validators"):
+            poly = validate_polygon_geometry(valid_coordinates)
+        assert isinstance(poly, Polygon)
+        assert "discarded" in caplog.text
+    
+    def test_trusted_skips_validity_check(self):
+        """Test trusted input bypasses the GEOS validity check"""
+        coords = make_coords([
+            (0, 0),
+            (1, 0),
+            (1, 1),
+            (0, 1),
+            (0, 0)
+        ])
+        with patch("validators.shapely.is_valid_reason") as is_valid_reason:
+            poly = validate_polygon_geometry(coords, trusted=True)
+        is_valid_reason.assert_not_called()
+        assert poly.area == 1
 
 
 # ========== COMPLEXITY VALIDATION ==========
@@ -206,19 +236,19 @@ class TestPolygonComplexity:
     
     def test_complex_polygon(self):
         """Test moderately complex polygon"""
-        coords = [
-            schemas.Coordinate(longitude=i*0.01, latitude=i*0.01)
+        coords = make_coords([
+            (i*0.01, i*0.01)
             for i in range(100)
-        ]
+        ])
         assert validate_polygon_complexity(coords) is True
     
+    @pytest.mark.xdist_group(name="big_polys")
     def test_too_complex_polygon(self):
         """Test polygon exceeding vertex limit"""
-        coords = [
-            schemas.Coordinate(longitude=i*0.001, latitude=i*0.001)
-            for i in range(1500)  # > MAX_VERTICES (1000)
-        ]
-        with pytest.raises(PolygonValidationError, match="too complex"):
+        # The validator accepts a (N, 2) array, so skip building Coordinate objects
+        steps = np.arange(1500) * 0.001  # > MAX_VERTICES (1000)
+        coords = np.column_stack([steps, steps])
+        with pytest.raises(PolygonValidationError, match=_RX["too_complex"]):
             validate_polygon_complexity(coords)
 
 
@@ -227,58 +257,36 @@ class TestPolygonComplexity:
 class TestPolygonArea:
     """Test polygon area calculations and limits"""
     
-    def test_valid_area(self, valid_coordinates):
+    def test_valid_area(self, valid_coordinates_poly):
         """Test polygon with valid area"""
-        points = [(c.longitude, c.latitude) for c in valid_coordinates]
-        poly = Polygon(points)
-        area = validate_polygon_area(poly)
+        area = validate_polygon_area(valid_coordinates_poly)
         assert 0 < area < 1000
     
-    def test_small_area(self):
+    def test_small_area(self, small_polygon):
         """Test small but valid area (1 hectare)"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=0.01, latitude=0),
-            schemas.Coordinate(longitude=0.01, latitude=0.01),
-            schemas.Coordinate(longitude=0, latitude=0.01),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
-        points = [(c.longitude, c.latitude) for c in coords]
-        poly = Polygon(points)
-        area = validate_polygon_area(poly)
+        area = validate_polygon_area(small_polygon)
         assert area > 0
     
-    def test_area_too_small(self):
+    def test_area_too_small(self, tiny_polygon):
         """Test area below minimum (< 0.01 km²)"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=0.0001, latitude=0),
-            schemas.Coordinate(longitude=0.0001, latitude=0.0001),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
-        points = [(c.longitude, c.latitude) for c in coords]
-        poly = Polygon(points)
-        with pytest.raises(PolygonValidationError, match="too small"):
-            validate_polygon_area(poly)
+        with pytest.raises(PolygonValidationError, match=_RX["too_small"]):
+            validate_polygon_area(tiny_polygon)
     
-    def test_area_too_large(self):
+    def test_area_too_small_skips_geodesic(self, tiny_polygon):
+        """Test bbox screen rejects tiny polygons before the geodesic integral"""
+        with patch("validators._geodesic_area_perimeter") as geodesic:
+            with pytest.raises(PolygonValidationError, match=_RX["too_small"]):
+                validate_polygon_area(tiny_polygon)
+        geodesic.assert_not_called()
+    
+    def test_area_too_large(self, large_polygon):
         """Test area exceeding maximum (> 1000 km²)"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=2, latitude=0),
-            schemas.Coordinate(longitude=2, latitude=2),
-            schemas.Coordinate(longitude=0, latitude=2),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
-        points = [(c.longitude, c.latitude) for c in coords]
-        poly = Polygon(points)
-        with pytest.raises(PolygonValidationError, match="too large"):
-            validate_polygon_area(poly)
+        with pytest.raises(PolygonValidationError, match=_RX["too_large"]):
+            validate_polygon_area(large_polygon)
     
-    def test_geodesic_area_calculation(self, valid_coordinates):
+    def test_geodesic_area_calculation(self, valid_coordinates_poly):
         """Test geodesic area is different from planar"""
-        points = [(c.longitude, c.latitude) for c in valid_coordinates]
-        poly = Polygon(points)
+        poly = valid_coordinates_poly
         
         geodesic_area = calculate_geodesic_area(poly)
         planar_area = poly.area * 111.32 * 111.32  # Rough conversion
@@ -292,45 +300,25 @@ class TestPolygonArea:
 class TestAspectRatio:
     """Test aspect ratio validation (no thin slivers)"""
     
-    def test_square_polygon(self):
+    def test_square_polygon(self, square_polygon):
         """Test square polygon has aspect ratio ~1"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=1),
-            schemas.Coordinate(longitude=0, latitude=1),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
-        points = [(c.longitude, c.latitude) for c in coords]
-        poly = Polygon(points)
-        assert validate_aspect_ratio(poly) is True
+        assert validate_aspect_ratio(square_polygon) is True
     
-    def test_reasonable_rectangle(self):
+    def test_reasonable_rectangle(self, rectangle_polygon):
         """Test rectangle with aspect ratio < 100"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=10, latitude=0),
-            schemas.Coordinate(longitude=10, latitude=1),
-            schemas.Coordinate(longitude=0, latitude=1),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
-        points = [(c.longitude, c.latitude) for c in coords]
-        poly = Polygon(points)
-        assert validate_aspect_ratio(poly) is True
+        assert validate_aspect_ratio(rectangle_polygon) is True
     
-    def test_thin_sliver(self):
+    def test_thin_sliver(self, sliver_polygon):
         """Test thin sliver polygon fails"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=200, latitude=0),
-            schemas.Coordinate(longitude=200, latitude=0.1),
-            schemas.Coordinate(longitude=0, latitude=0.1),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
-        points = [(c.longitude, c.latitude) for c in coords]
-        poly = Polygon(points)
-        with pytest.raises(PolygonValidationError, match="aspect ratio too extreme"):
-            validate_aspect_ratio(poly)
+        with pytest.raises(PolygonValidationError, match=_RX["aspect"]):
+            validate_aspect_ratio(sliver_polygon)
+    
+    def test_diagonal_sliver_strict(self):
+        """Test diagonal sliver passes the bbox check but fails strict mode"""
+        poly = Polygon([(0, 0), (10, 10), (10.05, 9.95), (0.05, -0.05), (0, 0)])
+        assert validate_aspect_ratio(poly) is True
+        with pytest.raises(PolygonValidationError, match=_RX["aspect"]):
+            validate_aspect_ratio(poly, strict=True)
 
 
 # ========== DUPLICATE POINTS CHECK ==========
@@ -344,13 +332,13 @@ class TestDuplicatePoints:
     
     def test_consecutive_duplicates(self):
         """Test detection of consecutive duplicate points"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0),  # Duplicate
-            schemas.Coordinate(longitude=1, latitude=1),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
+        coords = make_coords([
+            (0, 0),
+            (1, 0),
+            (1, 0),  # Duplicate
+            (1, 1),
+            (0, 0)
+        ])
         # Should warn but not fail
         assert check_duplicate_points(coords) is True
 
@@ -379,12 +367,12 @@ class TestFullValidation:
     
     def test_full_validation_all_checks(self):
         """Test all validation checks are executed"""
-        coords = [
-            schemas.Coordinate(longitude=0.28, latitude=51.50),
-            schemas.Coordinate(longitude=0.19, latitude=51.50),
-            schemas.Coordinate(longitude=0.39, latitude=51.52),
-            schemas.Coordinate(longitude=0.28, latitude=51.50)
-        ]
+        coords = make_coords([
+            (0.28, 51.50),
+            (0.19, 51.50),
+            (0.39, 51.52),
+            (0.28, 51.50)
+        ])
         
         result = validate_full_polygon(coords)
         
@@ -397,28 +385,67 @@ class TestFullValidation:
     def test_validation_failure_propagates(self):
         """Test that any validation failure stops pipeline"""
         # Out of range coordinates
-        coords = [
-            schemas.Coordinate(longitude=200, latitude=0),
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=0, latitude=1)
-        ]
+        coords = make_coords([
+            (200, 0),
+            (0, 0),
+            (0, 1)
+        ])
         
         with pytest.raises(PolygonValidationError):
             validate_full_polygon(coords)
     
     def test_auto_close_in_pipeline(self):
         """Test polygon is auto-closed during validation"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=0),
-            schemas.Coordinate(longitude=1, latitude=1)
+        coords = make_coords([
+            (0, 0),
+            (1, 0),
+            (1, 1)
             # Open polygon
-        ]
+        ])
         
         result = validate_full_polygon(coords)
         assert result["valid"] is True
         # Polygon should have been closed
         assert result["num_vertices"] == 4
+    
+    @pytest.mark.parametrize("dtype", [np.float32, np.int64])
+    def test_non_float64_array_input(self, dtype):
+        """Test non-float64 arrays are coerced, not misread as float64 bytes"""
+        ring = np.array([[10, 50], [11, 50], [11, 51], [10, 51]], dtype=dtype)
+        result = validate_full_polygon(ring)
+        assert result["num_vertices"] == 5  # auto-closed
+        assert result["bbox"][0] == pytest.approx(10)
+    
+    def test_array_input_wrong_shape(self):
+        """Test arrays not shaped (N, 2) are rejected"""
+        with pytest.raises(PolygonValidationError, match=r"\(N, 2\)"):
+            validate_full_polygon(np.zeros((4, 3)))
+    
+    def test_result_is_shared_read_only(self, valid_coordinates):
+        """Test cache hits share one read-only metadata mapping"""
+        result = validate_full_polygon(valid_coordinates)
+        assert validate_full_polygon(valid_coordinates) is result
+        with pytest.raises(TypeError):
+            result["valid"] = False
+        with pytest.raises(AttributeError):
+            result["centroid"].append(1)
+        assert len(validate_full_polygon(valid_coordinates)["centroid"]) == 2
+    
+    def test_dense_ring_simplified_in_pipeline(self):
+        """Test dense rings are simplified but report the submitted vertex count"""
+        theta = np.linspace(0, 2 * np.pi, 800, endpoint=False)
+        ring = np.column_stack([0.05 * np.cos(theta), 0.05 * np.sin(theta)])
+    
+        with patch("validators.simplify_polygon", wraps=simplify_polygon) as simplify:
+            result = validate_full_polygon(ring)
+    
+        simplify.assert_called()
+        assert result["num_vertices"] == 801  # auto-closed
+        # bbox describes the submitted ring, not the simplified one
+        assert result["bbox"] == pytest.approx(Polygon(ring).bounds, abs=1e-6)
+        assert result["area_km2"] == pytest.approx(
+            calculate_geodesic_area(Polygon(ring)), rel=1e-3
+        )
 
 
 # ========== METADATA EXTRACTION ==========
@@ -426,12 +453,9 @@ class TestFullValidation:
 class TestMetadataExtraction:
     """Test polygon metadata extraction"""
     
-    def test_get_polygon_metadata(self, valid_coordinates):
+    def test_get_polygon_metadata(self, valid_coordinates, valid_coordinates_poly):
         """Test metadata extraction"""
-        points = [(c.longitude, c.latitude) for c in valid_coordinates]
-        poly = Polygon(points)
-        
-        metadata = get_polygon_metadata(poly, valid_coordinates)
+        metadata = get_polygon_metadata(valid_coordinates_poly, valid_coordinates)
         
         assert "area_km2" in metadata
         assert "area_hectares" in metadata
@@ -444,22 +468,34 @@ class TestMetadataExtraction:
         assert metadata["num_vertices"] == len(valid_coordinates)
         assert len(metadata["centroid"]) == 2
         assert len(metadata["bbox"]) == 4
+    
+    def test_perimeter_ignores_holes(self):
+        """Test holes leave the exterior perimeter unchanged, as in coordinate_parser"""
+        shell = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]
+        hole = [[0.2, 0.2], [0.8, 0.2], [0.8, 0.8], [0.2, 0.8], [0.2, 0.2]]
+    
+        holed = get_polygon_metadata(Polygon(shell, [hole]), np.array(shell))
+        solid = get_polygon_metadata(Polygon(shell), np.array(shell))
+    
+        assert holed["perimeter_km"] == solid["perimeter_km"]
+        assert holed["area_km2"] == solid["area_km2"]
 
 
 # ========== EDGE CASES ==========
 
+@pytest.mark.xdist_group(name="big_polys")
 class TestEdgeCases:
     """Test edge cases and boundary conditions"""
     
     def test_polygon_at_dateline(self):
         """Test polygon crossing dateline (longitude ±180)"""
-        coords = [
-            schemas.Coordinate(longitude=179, latitude=0),
-            schemas.Coordinate(longitude=-179, latitude=0),
-            schemas.Coordinate(longitude=-179, latitude=1),
-            schemas.Coordinate(longitude=179, latitude=1),
-            schemas.Coordinate(longitude=179, latitude=0)
-        ]
+        coords = make_coords([
+            (179, 0),
+            (-179, 0),
+            (-179, 1),
+            (179, 1),
+            (179, 0)
+        ])
         
         # Should handle dateline crossing
         result = validate_full_polygon(coords)
@@ -467,39 +503,39 @@ class TestEdgeCases:
     
     def test_polygon_at_poles(self):
         """Test polygon near poles"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=89),
-            schemas.Coordinate(longitude=90, latitude=89),
-            schemas.Coordinate(longitude=90, latitude=89.5),
-            schemas.Coordinate(longitude=0, latitude=89.5),
-            schemas.Coordinate(longitude=0, latitude=89)
-        ]
+        coords = make_coords([
+            (0, 89),
+            (90, 89),
+            (90, 89.5),
+            (0, 89.5),
+            (0, 89)
+        ])
         
         result = validate_full_polygon(coords)
         assert result["valid"] is True
     
     def test_polygon_at_equator(self):
         """Test polygon at equator"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=-1),
-            schemas.Coordinate(longitude=1, latitude=-1),
-            schemas.Coordinate(longitude=1, latitude=1),
-            schemas.Coordinate(longitude=0, latitude=1),
-            schemas.Coordinate(longitude=0, latitude=-1)
-        ]
+        coords = make_coords([
+            (0, -1),
+            (1, -1),
+            (1, 1),
+            (0, 1),
+            (0, -1)
+        ])
         
         result = validate_full_polygon(coords)
         assert result["valid"] is True
     
     def test_very_small_valid_polygon(self):
         """Test smallest valid polygon (just above minimum)"""
-        coords = [
-            schemas.Coordinate(longitude=0, latitude=0),
-            schemas.Coordinate(longitude=0.015, latitude=0),
-            schemas.Coordinate(longitude=0.015, latitude=0.015),
-            schemas.Coordinate(longitude=0, latitude=0.015),
-            schemas.Coordinate(longitude=0, latitude=0)
-        ]
+        coords = make_coords([
+            (0, 0),
+            (0.015, 0),
+            (0.015, 0.015),
+            (0, 0.015),
+            (0, 0)
+        ])
         
         result = validate_full_polygon(coords)
         assert result["valid"] is True
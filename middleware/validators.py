@@ -4,10 +4,14 @@ Validates user-submitted polygons for geometry, area, and GEE quota compliance
 Prevents invalid/malicious inputs from reaching backend
 """
 
+import shapely
 from shapely.geometry import Polygon, Point, MultiPolygon
-from shapely.validation import explain_validity
 from pyproj import Geod
-from typing import List, Dict, Tuple
+from typing import List, Dict, Mapping, Optional, Tuple, Union
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+import numpy as np
 import logging
 import schemas  # Import Coordinate model
 
@@ -29,16 +33,117 @@ MAX_AREA_KM2 = 30000  # Maximum polygon area (GEE quota protection)
 MAX_VERTICES = 1000  # Maximum polygon complexity
 MIN_AREA_KM2 = 0.01  # Minimum area (0.01 km² = 1 hectare)
 MAX_ASPECT_RATIO = 100  # Max length/width ratio (detects thin slivers)
+KM_PER_DEG = 111.32  # Approximate km per degree of latitude
+SIMPLIFY_VERTEX_THRESHOLD = 500  # Rings above this are simplified before measurement
+SIMPLIFY_TOLERANCE_DEG = 1e-5  # Starting simplification tolerance (≈ 1 m)
+SIMPLIFY_MAX_ATTEMPTS = 4  # Tolerance doublings tried before keeping the original ring
+VALIDATION_CACHE_SIZE = 1024  # Distinct polygons whose validation results are memoized
+BBOX_SCREEN_MARGIN = 10  # Safety factor for the bbox-only too-small screen
+CLOSURE_TOL_DEG = 1e-9  # Max endpoint gap (degrees) for a ring to count as closed
+NO_AREA_EPS_DEG2 = 1e-12  # Fan area (deg²) below which vertices count as collinear
+
+# shapely.get_type_id code for Polygon
+POLYGON_TYPE_ID = 3
+
+# shapely.is_valid_reason result for a valid geometry
+VALID_GEOMETRY = "Valid Geometry"
+
+# GEOS invalidity reasons that a make_valid repair can fix (crossing or touching edges)
+REPAIRABLE_REASONS = ("Self-intersection", "Ring Self-intersection")
+
+# Geodesic calculator (WGS84 ellipsoid), shared by all area/perimeter calls
+GEOD = Geod(ellps="WGS84")
+
+# ========== ARRAY HELPERS ==========
+
+def coords_to_array(coords: Union[List[schemas.Coordinate], np.ndarray]) -> np.ndarray:
+    """
+    Pack Coordinate objects into a contiguous (N, 2) float64 [lon, lat] array
+    A prebuilt array is passed through, so callers (main.py) can convert the
+    request once and hand the same array to every validator and parser
+    
+    Args:
+        coords: List of Coordinate objects, or an existing (N, 2) array
+    
+    Returns:
+        numpy array of shape (N, 2)
+    
+    Raises:
+        PolygonValidationError: If an array input is not shaped (N, 2)
+    """
+    if isinstance(coords, np.ndarray):
+        # Coerce other dtypes/layouts: callers key caches on the raw float64 bytes
+        arr = np.ascontiguousarray(coords, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise PolygonValidationError(
+                f"Coordinates must be an (N, 2) array of [longitude, latitude], "
+                f"got shape {arr.shape}"
+            )
+        return arr
+    # One pass over the objects, filling the interleaved buffer directly
+    n = len(coords)
+    flat = np.fromiter(
+        chain.from_iterable((c.longitude, c.latitude) for c in coords),
+        dtype=np.float64,
+        count=2 * n
+    )
+    return flat.reshape(n, 2)
+
+def _consecutive_duplicates(arr: np.ndarray) -> np.ndarray:
+    """
+    Flag vertices identical to their predecessor (one vectorized row compare)
+    
+    Args:
+        arr: (N, 2) array of [lon, lat] vertices
+    
+    Returns:
+        Boolean mask of shape (N - 1,); entry i is True if vertex i+1 repeats vertex i
+    """
+    return (arr[1:] == arr[:-1]).all(axis=1)
+
+def _fan_area_deg2(arr: np.ndarray) -> float:
+    """
+    Sum of absolute triangle-fan areas around the first vertex, in degrees²
+    Zero only when every vertex lies on one line; unlike the signed shoelace
+    area it stays positive for self-intersecting rings such as a bow-tie
+    
+    Args:
+        arr: (N, 2) array of [lon, lat] ring vertices
+    
+    Returns:
+        Fan area in square degrees
+    """
+    rel = arr[1:] - arr[0]
+    cross = rel[:-1, 0] * rel[1:, 1] - rel[1:, 0] * rel[:-1, 1]
+    return 0.5 * float(np.abs(cross).sum())
+
+def _within_earth_bounds(arr: np.ndarray) -> bool:
+    """
+    True if every [lon, lat] row is within [-180, 180] x [-90, 90]
+    Two column reductions instead of per-element masks; NaN propagates
+    through min/max and fails the comparisons, so it counts as out of range
+    
+    Args:
+        arr: (N, 2) array of [lon, lat] vertices
+    
+    Returns:
+        Whether all coordinates are in range (True for an empty array)
+    """
+    if not len(arr):
+        return True
+    lo = arr.min(axis=0)
+    hi = arr.max(axis=0)
+    return bool(lo[0] >= -180 and hi[0] <= 180 and lo[1] >= -90 and hi[1] <= 90)
 
 # ========== VALIDATION FUNCTIONS ==========
 
-def validate_coordinate_range(coords: List[schemas.Coordinate]) -> bool:
+def validate_coordinate_range(coords: Union[List[schemas.Coordinate], np.ndarray]) -> bool:
     """
     Validate coordinates are within valid Earth bounds
     Longitude: -180 to 180, Latitude: -90 to 90
     
     Args:
-        coords: List of Coordinate objects from request
+        coords: List of Coordinate objects from request (or their (N, 2) array)
     
     Returns:
         True if all coordinates valid
@@ -46,25 +151,29 @@ def validate_coordinate_range(coords: List[schemas.Coordinate]) -> bool:
     Raises:
         PolygonValidationError: If any coordinate out of range
     """
-    for i, coord in enumerate(coords):
-        # Check longitude
-        if not (-180 <= coord.longitude <= 180):
-            raise PolygonValidationError(
-                f"Point {i+1}: Longitude {coord.longitude}° is out of valid range [-180, 180]. "
-                f"Check coordinate order (longitude, latitude)."
-            )
-        
-        # Check latitude
-        if not (-90 <= coord.latitude <= 90):
-            raise PolygonValidationError(
-                f"Point {i+1}: Latitude {coord.latitude}° is out of valid range [-90, 90]. "
-                f"Check coordinate order (longitude, latitude)."
-            )
-    
-    logger.debug(f"✓ All {len(coords)} coordinates within valid range")
-    return True
+    arr = coords_to_array(coords)
+    if _within_earth_bounds(arr):
+        logger.debug("✓ All %d coordinates within valid range", len(arr))
+        return True
+    
+    # Something is out of range: locate the first offending point,
+    # longitude before latitude (negated tests so NaN is caught too)
+    lon = arr[:, 0]
+    lat = arr[:, 1]
+    bad_lon = ~((lon >= -180) & (lon <= 180))
+    bad_lat = ~((lat >= -90) & (lat <= 90))
+    i = int(np.argmax(bad_lon | bad_lat))
+    if bad_lon[i]:
+        raise PolygonValidationError(
+            f"Point {i+1}: Longitude {lon[i]}° is out of valid range [-180, 180]. "
+            f"Check coordinate order (longitude, latitude)."
+        )
+    raise PolygonValidationError(
+        f"Point {i+1}: Latitude {lat[i]}° is out of valid range [-90, 90]. "
+        f"Check coordinate order (longitude, latitude)."
+    )
 
-def validate_minimum_points(coords: List[schemas.Coordinate], min_points: int = 3) -> bool:
+def validate_minimum_points(coords: Union[List[schemas.Coordinate], np.ndarray], min_points: int = 3) -> bool:
     """
     Ensure polygon has minimum required vertices
     
@@ -84,48 +193,64 @@ def validate_minimum_points(coords: List[schemas.Coordinate], min_points: int =
             f"Received only {len(coords)} points."
         )
     
-    logger.debug(f"✓ Polygon has {len(coords)} vertices (>= {min_points})")
+    logger.debug("✓ Polygon has %d vertices (>= %d)", len(coords), min_points)
     return True
 
-def validate_polygon_closed(coords: List[schemas.Coordinate]) -> List[schemas.Coordinate]:
+def validate_polygon_closed(
+    coords: Union[List[schemas.Coordinate], np.ndarray]
+) -> Union[List[schemas.Coordinate], np.ndarray]:
     """
     Ensure polygon is closed (first point == last point)
     Auto-closes if needed
     
     Args:
-        coords: List of coordinates
+        coords: List of coordinates (or their (N, 2) array)
     
     Returns:
-        Closed coordinate list (may append first point)
+        Closed coordinates; if the first point had to be appended, a new
+        list (or array) is returned and the input is left untouched
     """
     if len(coords) < 3:
         return coords
     
-    first = coords[0]
-    last = coords[-1]
+    is_array = isinstance(coords, np.ndarray)
+    if is_array:
+        (first_lon, first_lat), (last_lon, last_lat) = coords[0], coords[-1]
+    else:
+        first_lon, first_lat = coords[0].longitude, coords[0].latitude
+        last_lon, last_lat = coords[-1].longitude, coords[-1].latitude
     
     # Check if already closed (within small tolerance for floating point)
     is_closed = (
-        abs(first.longitude - last.longitude) < 1e-9 and
-        abs(first.latitude - last.latitude) < 1e-9
+        abs(first_lon - last_lon) < CLOSURE_TOL_DEG and
+        abs(first_lat - last_lat) < CLOSURE_TOL_DEG
     )
     
     if not is_closed:
         # Auto-close by appending first point
-        coords.append(first)
+        if is_array:
+            coords = np.vstack([coords, coords[:1]])
+        else:
+            coords = [*coords, coords[0]]
         logger.debug("✓ Auto-closed polygon (appended first vertex)")
     else:
         logger.debug("✓ Polygon already closed")
     
     return coords
 
-def validate_polygon_geometry(coords: List[schemas.Coordinate]) -> Polygon:
+def validate_polygon_geometry(
+    coords: Union[List[schemas.Coordinate], np.ndarray],
+    repeats: Optional[np.ndarray] = None,
+    trusted: bool = False
+) -> Polygon:
     """
     Validate polygon geometry using Shapely
     Checks for self-intersection, validity, and non-zero area
     
     Args:
-        coords: List of coordinates
+        coords: List of coordinates (or their (N, 2) array)
+        repeats: Precomputed consecutive-duplicate mask, if available
+        trusted: Skip the GEOS validity check (caller guarantees a simple ring)
     
     Returns:
         Shapely Polygon object
@@ -133,67 +258,71 @@ def validate_polygon_geometry(coords: List[schemas.Coordinate]) -> Polygon:
     Raises:
         PolygonValidationError: If geometry invalid
     """
-    # Convert to Shapely points
-    points = [(c.longitude, c.latitude) for c in coords]
+    # Convert to an (N, 2) array Shapely can consume directly
+    points = coords_to_array(coords)
+    
+    # Fast reject: collinear vertices have no area, so skip building a GEOS polygon
+    if len(points) >= 3 and _fan_area_deg2(points) < NO_AREA_EPS_DEG2:
+        raise PolygonValidationError(
+            "Polygon has no area. All points may be collinear (on same line)."
+        )
+    
+    # Drop consecutive duplicate vertices so GEOS builds and checks a shorter ring
+    if repeats is None:
+        repeats = _consecutive_duplicates(points)
+    if repeats.any():
+        points = points[np.concatenate(([True], ~repeats))]
     
     try:
-        poly = Polygon(points)
+        # Vectorized constructor reads the contiguous float64 buffer directly
+        poly = shapely.polygons(points)
     except Exception as e:
         raise PolygonValidationError(
             f"Failed to create polygon from coordinates: {str(e)}"
         )
 
-    # If geometry invalid try a gentle auto-fix (buffer(0)) which often
-    # cleans self-intersections/mild topology issues. If that yields a
-    # valid polygon, accept the fixed geometry; otherwise fail with reason.
-    # Keep original (possibly invalid) polygon area to decide on auto-fix heuristics
-    original_area = poly.area
-
-    if not poly.is_valid:
-        reason = explain_validity(poly)
-        # If original polygon has zero area (e.g., classic bow-tie or collinear points),
-        # don't attempt an auto-fix — treat as invalid so tests expecting failure get it.
-        if original_area == 0:
-            raise PolygonValidationError(
-                f"Invalid polygon geometry: {reason}. "
-                f"Common issues: self-intersecting edges, duplicate consecutive points."
-            )
-
+    # One GEOS call answers both "is it valid?" and "why not?"
+    reason = VALID_GEOMETRY if trusted else shapely.is_valid_reason(poly)
+    if reason != VALID_GEOMETRY:
+        invalid_msg = (
+            f"Invalid polygon geometry: {reason}. "
+            f"Common issues: self-intersecting edges, duplicate consecutive points."
+        )
+        
+        # Zero-area rings (e.g., classic bow-tie) and problems make_valid can't
+        # repair fail outright, without paying for the auto-fix
+        if poly.area == 0 or not reason.startswith(REPAIRABLE_REASONS):
+            raise PolygonValidationError(invalid_msg)
+        
+        # Auto-fix: make_valid splits crossing edges into valid pieces
         try:
-            fixed = poly.buffer(0)
-            # Only accept a fixed geometry if it is a single Polygon with area.
-            # If buffer yields a MultiPolygon or GeometryCollection, treat as invalid
-            # (likely a true self-intersection that shouldn't be auto-fixed).
-            if isinstance(fixed, Polygon) and fixed.is_valid and not fixed.is_empty and fixed.area > 0:
-                logger.debug("✓ Auto-fixed invalid polygon using buffer(0)")
-                poly = fixed
-            else:
-                # If buffer produced empty geometry, prefer a more direct
-                # no-area message so tests expecting "no area" match.
-                if fixed.is_empty or getattr(fixed, 'area', 0) == 0:
-                    raise PolygonValidationError(
-                        "Polygon has no area. All points may be collinear (on same line)."
-                    )
-                raise PolygonValidationError(
-                    f"Invalid polygon geometry: {reason}. "
-                    f"Common issues: self-intersecting edges, duplicate consecutive points."
-                )
-                # If original polygon has zero area (e.g., classic bow-tie or collinear points),
-                # don't attempt an auto-fix — treat as invalid so tests expecting failure get it.
-                if original_area == 0:
-                    raise PolygonValidationError(
-                        f"Invalid polygon geometry: {reason}. "
-                        f"Common issues: self-intersecting edges, duplicate consecutive points."
-                    )
-        except PolygonValidationError:
-            # Re-raise our own clear errors
-            raise
+            fixed = shapely.make_valid(poly)
         except Exception:
-            # If buffer fix fails for some reason, fall back to original reason
+            raise PolygonValidationError(invalid_msg)
+        
+        # Pieces come back as a MultiPolygon or GeometryCollection (possibly
+        # with stray lines); keep the largest polygon. The other pieces are
+        # dropped (the old buffer(0) path rejected multi-part repairs outright),
+        # so warn with how much of the submitted area is discarded
+        parts = shapely.get_parts(shapely.get_parts(fixed))
+        parts = parts[shapely.get_type_id(parts) == POLYGON_TYPE_ID]
+        areas = shapely.area(parts)
+        if not len(parts) or areas.max() == 0:
             raise PolygonValidationError(
-                f"Invalid polygon geometry: {reason}. "
-                f"Common issues: self-intersecting edges, duplicate consecutive points."
+                "Polygon has no area. All points may be collinear (on same line)."
+            )
+        
+        largest = int(np.argmax(areas))
+        if len(parts) > 1:
+            logger.warning(
+                "⚠️ Self-intersecting polygon split into %d pieces; kept the largest "
+                "and discarded %.1f%% of the repaired area (%.6g of %.6g deg²)",
+                len(parts), 100 * (1 - areas[largest] / areas.sum()),
+                areas.sum() - areas[largest], areas.sum()
             )
+        
+        logger.debug("✓ Auto-fixed invalid polygon using make_valid")
+        poly = parts[largest]
     
     # Check if empty (collinear points)
     if poly.is_empty:
@@ -207,15 +336,19 @@ def validate_polygon_geometry(coords: List[schemas.Coordinate]) -> Polygon:
             "Polygon area is zero. Check that points form a valid closed shape."
         )
     
-    logger.debug(f"✓ Polygon geometry valid (Shapely validation passed)")
+    logger.debug("✓ Polygon geometry valid (Shapely validation passed)")
     return poly
 
-def validate_polygon_complexity(coords: List[schemas.Coordinate]) -> bool:
+def validate_polygon_complexity(
+    coords: Union[List[schemas.Coordinate], np.ndarray],
+    max_vertices: int = MAX_VERTICES
+) -> bool:
     """
     Check polygon isn't too complex (performance protection)
     
     Args:
         coords: List of coordinates
+        max_vertices: Maximum vertices allowed (default MAX_VERTICES, bound at import)
     
     Returns:
         True if complexity acceptable
@@ -224,56 +357,155 @@ def validate_polygon_complexity(coords: List[schemas.Coordinate]) -> bool:
         PolygonValidationError: If too many vertices
     """
     num_vertices = len(coords)
-    if num_vertices > MAX_VERTICES:
+    if num_vertices > max_vertices:
         raise PolygonValidationError(
-            f"Polygon too complex: {num_vertices} vertices exceeds limit of {MAX_VERTICES}. "
+            f"Polygon too complex: {num_vertices} vertices exceeds limit of {max_vertices}. "
             f"Simplify polygon or split into multiple requests."
         )
     
-    logger.debug(f"✓ Polygon complexity acceptable ({num_vertices}/{MAX_VERTICES} vertices)")
+    logger.debug("✓ Polygon complexity acceptable (%d/%d vertices)", num_vertices, max_vertices)
     return True
 
-def calculate_geodesic_area(poly: Polygon) -> float:
+def _approximate_area_km2(ring: np.ndarray) -> float:
     """
-    Calculate actual polygon area accounting for Earth's curvature
-    Uses WGS84 ellipsoid for accurate area on spherical surface
+    Approximate ring area on a sinusoidal (equal-area) projection
+    Each vertex's longitude is scaled by cos(latitude) in one vectorized
+    pass; within a few percent of the WGS84 area for regional polygons
     
     Args:
-        poly: Shapely Polygon object
+        ring: (N, 2) array of [lon, lat] vertices
     
     Returns:
         Area in square kilometers
     """
-    geod = Geod(ellps="WGS84")
+    lon = ring[:, 0] * np.cos(np.radians(ring[:, 1]))
+    lat = ring[:, 1]
+    twice_area = np.dot(lon, np.roll(lat, -1)) - np.dot(np.roll(lon, -1), lat)
+    return 0.5 * abs(float(twice_area)) * KM_PER_DEG * KM_PER_DEG
+
+def _ring_area_perimeter(ring: np.ndarray) -> Tuple[float, float]:
+    """
+    Signed geodesic area and perimeter of one closed ring
+    
+    Args:
+        ring: (N, 2) array of [lon, lat] vertices, first vertex repeated at the end
+    
+    Returns:
+        Tuple of (signed area in m², perimeter in m)
+    """
+    # Shapely rings repeat the first vertex at the end; drop it so the
+    # closing edge isn't counted twice
+    return GEOD.polygon_area_perimeter(ring[:-1, 0], ring[:-1, 1])
+
+def _geodesic_area_perimeter(poly: Polygon) -> Tuple[float, float]:
+    """
+    Geodesic exterior area and perimeter from one pyproj integral
+    
+    Args:
+        poly: Shapely Polygon object
+    
+    Returns:
+        Tuple of (unsigned exterior area in m², exterior perimeter in m)
+    
+    Raises:
+        PolygonValidationError: If the geodesic calculation fails
+    """
     try:
-        # Use the explicit polygon area routine which takes lon/lat sequences.
-        # This is more robust across shapely/geod versions than geometry_area_perimeter
-        # for small polygons and yields a stable geodesic area in m².
-        exterior_coords = list(poly.exterior.coords)
-        if len(exterior_coords) < 3:
-            return 0.0
-
-        # Remove duplicate closing point if present to avoid double-counting
-        if exterior_coords[0] == exterior_coords[-1]:
-            exterior_coords = exterior_coords[:-1]
-
-        lons, lats = zip(*exterior_coords)
-        area_m2, perimeter_m = geod.polygon_area_perimeter(lons, lats)
-        area_km2 = abs(area_m2) / 1_000_000  # Convert m² to km²
-        logger.debug(f"Geodesic area: {area_km2:.2f} km² (perimeter: {perimeter_m/1000:.2f} km)")
-        return area_km2
+        # One vectorized fetch of the vertices; holes are ignored, matching
+        # coordinate_parser, and the .exterior accessor costs more than PROJ
+        if shapely.get_num_interior_rings(poly) == 0:
+            ring = shapely.get_coordinates(poly)
+        else:
+            ring = shapely.get_coordinates(shapely.get_exterior_ring(poly))
+        if len(ring) < 4:
+            return 0.0, 0.0
+        
+        area_m2, perimeter_m = _ring_area_perimeter(ring)
+        
+        return abs(area_m2), perimeter_m
     except Exception as e:
         raise PolygonValidationError(
             f"Failed to calculate polygon area: {str(e)}"
         )
 
-def validate_polygon_area(poly: Polygon) -> float:
+def _bbox_area_upper_bound_km2(bounds: Tuple[float, float, float, float]) -> float:
+    """
+    Constant-time upper bound on a polygon's area from its bounding box
+    Scales the longitude span by cos of the bbox latitude nearest the
+    equator, so the bound never undercuts the enclosed area
+    
+    Args:
+        bounds: (minx, miny, maxx, maxy) in degrees
+    
+    Returns:
+        Bounding-box area upper bound in square kilometers
+    """
+    minx, miny, maxx, maxy = bounds
+    nearest_equator = 0.0 if miny <= 0 <= maxy else min(abs(miny), abs(maxy))
+    return (
+        (maxx - minx) * KM_PER_DEG * np.cos(np.radians(nearest_equator))
+        * (maxy - miny) * KM_PER_DEG
+    )
+
+def _screen_bbox_area(
+    bounds: Tuple[float, float, float, float],
+    min_area_km2: float = MIN_AREA_KM2
+):
+    """
+    Reject polygons whose bounding box alone is far below the minimum area,
+    before paying for the geodesic integral
+    
+    Args:
+        bounds: (minx, miny, maxx, maxy) in degrees
+        min_area_km2: Minimum area allowed (default MIN_AREA_KM2, bound at import)
+    
+    Raises:
+        PolygonValidationError: If the bbox area bound is below min_area_km2 / BBOX_SCREEN_MARGIN
+    """
+    bound_km2 = _bbox_area_upper_bound_km2(bounds)
+    if bound_km2 < min_area_km2 / BBOX_SCREEN_MARGIN:
+        raise PolygonValidationError(
+            f"Polygon area too small: bounding box covers at most {bound_km2:.4f} km², "
+            f"below minimum {min_area_km2} km² ({min_area_km2 * 100} hectares). "
+            f"RUSLE results may be unreliable for very small areas."
+        )
+
+def calculate_geodesic_area(poly: Polygon, approximate: bool = False) -> float:
+    """
+    Calculate actual polygon area accounting for Earth's curvature
+    Uses WGS84 ellipsoid for accurate area on spherical surface
+    
+    Args:
+        poly: Shapely Polygon object
+        approximate: Use the cheap sinusoidal-projection estimate instead of
+            the pyproj geodesic integral (for screening, not reporting)
+    
+    Returns:
+        Area in square kilometers
+    """
+    if approximate:
+        return _approximate_area_km2(np.asarray(poly.exterior.coords))
+    
+    area_m2, perimeter_m = _geodesic_area_perimeter(poly)
+    area_km2 = area_m2 / 1_000_000  # Convert m² to km²
+    logger.debug("Geodesic area: %.2f km² (perimeter: %.2f km)", area_km2, perimeter_m / 1000)
+    return area_km2
+
+def validate_polygon_area(
+    poly: Polygon,
+    area_km2: Optional[float] = None,
+    min_area_km2: float = MIN_AREA_KM2,
+    max_area_km2: float = MAX_AREA_KM2
+) -> float:
     """
     Validate polygon area is within acceptable limits
     Protects against GEE quota exhaustion and performance issues
     
     Args:
         poly: Shapely Polygon object
+        area_km2: Precomputed geodesic area, if available
+        min_area_km2: Minimum area allowed (default MIN_AREA_KM2, bound at import)
+        max_area_km2: Maximum area allowed (default MAX_AREA_KM2, bound at import)
     
     Returns:
         Area in square kilometers
@@ -281,34 +513,45 @@ def validate_polygon_area(poly: Polygon) -> float:
     Raises:
         PolygonValidationError: If area too large or too small
     """
-    area_km2 = calculate_geodesic_area(poly)
+    if area_km2 is None:
+        _screen_bbox_area(poly.bounds, min_area_km2)
+        area_km2 = calculate_geodesic_area(poly)
     
     # Check minimum area
-    if area_km2 < MIN_AREA_KM2:
+    if area_km2 < min_area_km2:
         raise PolygonValidationError(
-            f"Polygon area too small: {area_km2:.4f} km² is below minimum {MIN_AREA_KM2} km² "
-            f"({MIN_AREA_KM2 * 100} hectares). "
+            f"Polygon area too small: {area_km2:.4f} km² is below minimum {min_area_km2} km² "
+            f"({min_area_km2 * 100} hectares). "
             f"RUSLE results may be unreliable for very small areas."
         )
     
     # Check maximum area (GEE quota protection)
-    if area_km2 > MAX_AREA_KM2:
+    if area_km2 > max_area_km2:
         raise PolygonValidationError(
-            f"Polygon area too large: {area_km2:.1f} km² exceeds limit of {MAX_AREA_KM2} km². "
+            f"Polygon area too large: {area_km2:.1f} km² exceeds limit of {max_area_km2} km². "
             f"Please select a smaller area or split into multiple requests. "
             f"This limit prevents Google Earth Engine quota exhaustion."
         )
     
-    logger.debug(f"✓ Polygon area within limits: {area_km2:.2f} km²")
+    logger.debug("✓ Polygon area within limits: %.2f km²", area_km2)
     return area_km2
 
-def validate_aspect_ratio(poly: Polygon) -> bool:
+def validate_aspect_ratio(
+    poly: Polygon,
+    bounds: Optional[Tuple[float, float, float, float]] = None,
+    strict: bool = False,
+    max_aspect_ratio: float = MAX_ASPECT_RATIO
+) -> bool:
     """
     Check polygon isn't a thin sliver (extreme aspect ratio)
     Slivers can cause GEE sampling issues and unreliable results
     
     Args:
         poly: Shapely Polygon object
+        bounds: Precomputed poly.bounds (minx, miny, maxx, maxy), if available
+        strict: Measure the minimum rotated rectangle instead of the
+            axis-aligned bbox, catching slivers that run diagonally (slower)
+        max_aspect_ratio: Maximum length/width ratio (default MAX_ASPECT_RATIO, bound at import)
     
     Returns:
         True if aspect ratio acceptable
@@ -316,51 +559,62 @@ def validate_aspect_ratio(poly: Polygon) -> bool:
     Raises:
         PolygonValidationError: If aspect ratio too extreme
     """
-    # Get bounding box
-    minx, miny, maxx, maxy = poly.bounds
-    width = maxx - minx
-    height = maxy - miny
+    if strict:
+        # Side lengths of the oriented bounding rectangle
+        rect = poly.minimum_rotated_rectangle
+        if isinstance(rect, Polygon):
+            corners = np.asarray(rect.exterior.coords)
+            width = float(np.hypot(*(corners[1] - corners[0])))
+            height = float(np.hypot(*(corners[2] - corners[1])))
+        else:
+            width = height = 0.0  # degenerate (line or point)
+    else:
+        # Get bounding box
+        minx, miny, maxx, maxy = bounds if bounds is not None else poly.bounds
+        width = maxx - minx
+        height = maxy - miny
+    
+    # Order the sides once so the ratio needs a single division
+    long_side, short_side = (width, height) if width >= height else (height, width)
     
-    # Avoid division by zero
-    if width == 0 or height == 0:
+    # Avoid division by zero (sides are non-negative, so only the short one can be 0)
+    if short_side == 0:
         raise PolygonValidationError(
             "Polygon has zero width or height (forms a line)."
         )
     
     # Calculate aspect ratio (always >= 1)
-    aspect_ratio = max(width / height, height / width)
+    aspect_ratio = long_side / short_side
     
-    if aspect_ratio > MAX_ASPECT_RATIO:
+    if aspect_ratio > max_aspect_ratio:
         raise PolygonValidationError(
-            f"Polygon aspect ratio too extreme: {aspect_ratio:.1f}:1 exceeds limit of {MAX_ASPECT_RATIO}:1. "
+            f"Polygon aspect ratio too extreme: {aspect_ratio:.1f}:1 exceeds limit of {max_aspect_ratio}:1. "
             f"Polygon appears to be a thin sliver, which may cause unreliable erosion estimates. "
             f"Try a more compact polygon shape."
         )
     
-    logger.debug(f"✓ Aspect ratio acceptable: {aspect_ratio:.1f}:1")
+    logger.debug("✓ Aspect ratio acceptable: %.1f:1", aspect_ratio)
     return True
 
-def check_duplicate_points(coords: List[schemas.Coordinate]) -> bool:
+def check_duplicate_points(
+    coords: Union[List[schemas.Coordinate], np.ndarray],
+    repeats: Optional[np.ndarray] = None
+) -> bool:
     """
     Warn about consecutive duplicate points (may indicate frontend error)
     
     Args:
-        coords: List of coordinates
+        coords: List of coordinates (or their (N, 2) array)
+        repeats: Precomputed consecutive-duplicate mask, if available
     
     Returns:
         True (does not raise, only warns)
     """
-    duplicates = []
-    for i in range(len(coords) - 1):
-        curr = coords[i]
-        next_pt = coords[i + 1]
-        
-        # Check if consecutive points are identical
-        if (curr.longitude == next_pt.longitude and
-            curr.latitude == next_pt.latitude):
-            duplicates.append(i + 1)
+    if repeats is None:
+        repeats = _consecutive_duplicates(coords_to_array(coords))
     
-    if duplicates:
+    if repeats.any():
+        duplicates = (np.flatnonzero(repeats) + 1).tolist()
         logger.warning(
             f"⚠️ Found {len(duplicates)} consecutive duplicate points at indices: {duplicates}. "
             f"This may reduce polygon quality."
@@ -368,37 +622,107 @@ def check_duplicate_points(coords: List[schemas.Coordinate]) -> bool:
     
     return True
 
-def get_polygon_metadata(poly: Polygon, coords: List[schemas.Coordinate]) -> Dict:
+def get_polygon_metadata(
+    poly: Polygon,
+    coords: Union[List[schemas.Coordinate], np.ndarray],
+    bounds: Optional[Tuple[float, float, float, float]] = None,
+    area_km2: Optional[float] = None,
+    perimeter_m: Optional[float] = None
+) -> Dict:
     """
     Extract useful polygon metadata for logging/response
     
     Args:
         poly: Shapely Polygon object
         coords: Original coordinate list
+        bounds: Precomputed poly.bounds (minx, miny, maxx, maxy), if available
+        area_km2: Precomputed geodesic area, if available
+        perimeter_m: Precomputed geodesic perimeter in metres, if available
     
     Returns:
-        Dictionary with polygon metadata
+        Dictionary with polygon metadata (centroid and bbox as tuples)
     """
-    area_km2 = calculate_geodesic_area(poly)
-    centroid = poly.centroid
-    bounds = poly.bounds  # (minx, miny, maxx, maxy)
-    
-    # Calculate perimeter
-    geod = Geod(ellps="WGS84")
-    _, perimeter_m = geod.geometry_area_perimeter(poly)
+    if area_km2 is None or perimeter_m is None:
+        area_m2, perimeter_m = _geodesic_area_perimeter(poly)
+        if area_km2 is None:
+            area_km2 = area_m2 / 1_000_000
+    # One GEOS centroid call, both ordinates read together (Point.x/.y are a call each)
+    centroid_lon, centroid_lat = shapely.get_coordinates(shapely.centroid(poly))[0].tolist()
+    if bounds is None:
+        bounds = poly.bounds  # (minx, miny, maxx, maxy)
     
     return {
         "area_km2": round(area_km2, 4),
         "area_hectares": round(area_km2 * 100, 2),
-        "centroid": [round(centroid.x, 6), round(centroid.y, 6)],
-        "bbox": [round(b, 6) for b in bounds],
+        "centroid": (round(centroid_lon, 6), round(centroid_lat, 6)),
+        "bbox": tuple(round(b, 6) for b in bounds),
         "num_vertices": len(coords),
         "perimeter_km": round(perimeter_m / 1000, 2)
     }
 
+def _validate_shape_and_range(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pipeline prologue: range check, minimum vertex count, auto-close and
+    duplicate scan
+    Equivalent to validate_coordinate_range, validate_minimum_points and
+    validate_polygon_closed in order, but one step over the array; the
+    individual validators are only re-run to raise their error messages.
+    The consecutive-duplicate mask is computed once here and shared by the
+    geometry and duplicate-warning steps
+    
+    Args:
+        arr: (N, 2) array of [lon, lat] vertices
+    
+    Returns:
+        Tuple of (closed (N, 2) array, a new array if the first vertex was
+        appended; consecutive-duplicate mask of length N - 1)
+    
+    Raises:
+        PolygonValidationError: If a coordinate is out of range or there are too few points
+    """
+    if not _within_earth_bounds(arr):
+        validate_coordinate_range(arr)
+    
+    n = len(arr)
+    if n < 3:
+        validate_minimum_points(arr, min_points=3)
+    
+    first, last = arr[0], arr[-1]
+    if abs(first[0] - last[0]) >= CLOSURE_TOL_DEG or abs(first[1] - last[1]) >= CLOSURE_TOL_DEG:
+        arr = np.vstack([arr, arr[:1]])
+    
+    logger.debug("✓ %d coordinates in range; ring closed with %d vertices", n, len(arr))
+    return arr, _consecutive_duplicates(arr)
+
+def _simplify_for_measurement(poly: Polygon) -> Polygon:
+    """
+    Shrink a dense, already-validated ring before area/metadata steps, so
+    the reported area, perimeter and centroid are those of the simplified ring
+    Starts at SIMPLIFY_TOLERANCE_DEG and doubles the tolerance until the
+    simplified polygon is valid, giving up after SIMPLIFY_MAX_ATTEMPTS
+    
+    Args:
+        poly: Valid Shapely Polygon
+    
+    Returns:
+        Simplified Polygon, or the original if no attempt stayed valid
+    """
+    tolerance = SIMPLIFY_TOLERANCE_DEG
+    for _ in range(SIMPLIFY_MAX_ATTEMPTS):
+        simplified = simplify_polygon(poly, tolerance)
+        if isinstance(simplified, Polygon) and simplified.is_valid and not simplified.is_empty:
+            return simplified
+        tolerance *= 2
+    
+    logger.debug("Simplification never produced a valid polygon; keeping original ring")
+    return poly
+
 # ========== MAIN VALIDATION FUNCTION ==========
 
-def validate_full_polygon(coords: List[schemas.Coordinate]) -> Dict:
+def validate_full_polygon(
+    coords: Union[List[schemas.Coordinate], np.ndarray],
+    trusted: bool = False
+) -> Mapping:
     """
     Run complete polygon validation pipeline
     
@@ -408,58 +732,94 @@ def validate_full_polygon(coords: List[schemas.Coordinate]) -> Dict:
     1. Check coordinate ranges
     2. Ensure minimum points
     3. Close polygon if needed
-    4. Validate geometry (no self-intersections)
-    5. Check complexity (vertex count)
+    4. Check complexity (vertex count)
+    5. Validate geometry (no self-intersections)
     6. Validate area (min/max limits)
     7. Check aspect ratio (no thin slivers)
     8. Warn about duplicates
     
     Args:
-        coords: List of Coordinate objects from API request
+        coords: List of Coordinate objects from API request (or their (N, 2) array)
+        trusted: Skip the GEOS validity check in step 5, for rings already
+            known to be simple (e.g. re-validating our own output)
     
     Returns:
-        Dictionary with validation results and polygon metadata:
+        Read-only mapping with validation results and polygon metadata:
         {
             "valid": True,
             "area_km2": 25.3,
             "num_vertices": 5,
-            "centroid": [lon, lat],
-            "bbox": [minx, miny, maxx, maxy],
+            "centroid": (lon, lat),
+            "bbox": (minx, miny, maxx, maxy),
             ...
         }
     
     Raises:
         PolygonValidationError: If any validation check fails
+    
+    Note:
+        Successful results are memoized on the exact lon/lat values, so a
+        replayed polygon skips the pipeline. The result is a read-only view of
+        the cached metadata (no per-call copy) and every value in it is
+        immutable (centroid and bbox are tuples), so cache hits can't be
+        corrupted; use dict(...) and list(...) to get modifiable copies.
+        The caller's coordinate list is not modified.
+        Rings above SIMPLIFY_VERTEX_THRESHOLD vertices are simplified (≈ 1 m
+        tolerance) before measurement: area_km2, perimeter_km and centroid
+        are measured on the simplified ring, while num_vertices and bbox
+        describe the submitted one.
+    """
+    return _validate_full_polygon(coords_to_array(coords).tobytes(), trusted)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_full_polygon(key: bytes, trusted: bool = False) -> Mapping:
     """
-    logger.info(f"Starting polygon validation for {len(coords)} coordinates")
+    Cached worker behind validate_full_polygon
+    
+    Args:
+        key: Raw bytes of the (N, 2) float64 lon/lat array (hashable, exact)
+        trusted: Skip the GEOS validity check (see validate_full_polygon)
+    
+    Returns:
+        Read-only validation metadata (shared between cache hits)
+    """
+    arr = np.frombuffer(key, dtype=np.float64).reshape(-1, 2)
+    logger.info(f"Starting polygon validation for {len(arr)} coordinates")
     
     try:
-        # Step 1: Coordinate range validation
-        validate_coordinate_range(coords)
+        # Steps 1-3: Coordinate ranges, minimum points, close polygon if needed
+        arr, repeats = _validate_shape_and_range(arr)
         
-        # Step 2: Minimum points
-        validate_minimum_points(coords, min_points=3)
+        # Step 4: Complexity check (cheap; keeps oversized rings out of GEOS)
+        validate_polygon_complexity(arr)
         
-        # Step 3: Close polygon if needed
-        coords = validate_polygon_closed(coords)
+        # Step 5: Geometry validation
+        poly = validate_polygon_geometry(arr, repeats, trusted)
         
-        # Step 4: Geometry validation
-        poly = validate_polygon_geometry(coords)
+        # Bounds of the validated ring, taken before simplification can pull
+        # extreme vertices inward; extracted once, shared with later steps
+        bounds = poly.bounds
         
-        # Step 5: Complexity check
-        validate_polygon_complexity(coords)
+        # Step 5b: Simplify dense rings so later steps see fewer vertices
+        # (metadata still reports the submitted vertex count and bbox)
+        if shapely.get_num_coordinates(poly) > SIMPLIFY_VERTEX_THRESHOLD:
+            poly = _simplify_for_measurement(poly)
         
-        # Step 6: Area validation
-        area_km2 = validate_polygon_area(poly)
+        # Step 6: Area validation (bbox screen, then area and perimeter from
+        # one geodesic integral)
+        _screen_bbox_area(bounds)
+        area_m2, perimeter_m = _geodesic_area_perimeter(poly)
+        area_km2 = validate_polygon_area(poly, area_m2 / 1_000_000)
         
         # Step 7: Aspect ratio check
-        validate_aspect_ratio(poly)
+        validate_aspect_ratio(poly, bounds)
         
         # Step 8: Check for duplicates (warning only)
-        check_duplicate_points(coords)
+        check_duplicate_points(arr, repeats)
         
         # Get metadata
-        metadata = get_polygon_metadata(poly, coords)
+        metadata = get_polygon_metadata(poly, arr, bounds, area_km2, perimeter_m)
         metadata["valid"] = True
         
         logger.info(
@@ -468,7 +828,7 @@ def validate_full_polygon(coords: List[schemas.Coordinate]) -> Dict:
             f"{metadata['num_vertices']} vertices"
         )
         
-        return metadata
+        return MappingProxyType(metadata)
         
     except PolygonValidationError as e:
         logger.warning(f"❌ Polygon validation failed: {str(e)}")
@@ -479,6 +839,12 @@ def validate_full_polygon(coords: List[schemas.Coordinate]) -> Dict:
             f"Unexpected validation error: {str(e)}"
         )
 
+
+def clear_validation_cache():
+    """Clear memoized validate_full_polygon results"""
+    _validate_full_polygon.cache_clear()
+    logger.debug("Cleared polygon validation cache")
+
 # ========== UTILITY FUNCTIONS ==========
 
 def validate_bounding_box(bbox: List[float]) -> bool:
@@ -516,7 +882,7 @@ def validate_bounding_box(bbox: List[float]) -> bool:
     if miny >= maxy:
         raise PolygonValidationError(f"Bbox miny ({miny}) must be less than maxy ({maxy})")
     
-    logger.debug(f"✓ Bounding box valid: [{minx}, {miny}, {maxx}, {maxy}]")
+    logger.debug("✓ Bounding box valid: [%s, %s, %s, %s]", minx, miny, maxx, maxy)
     return True
 
 def simplify_polygon(poly: Polygon, tolerance: float = 0.001) -> Polygon:
@@ -532,12 +898,12 @@ def simplify_polygon(poly: Polygon, tolerance: float = 0.001) -> Polygon:
         Simplified Polygon
     """
     simplified = poly.simplify(tolerance, preserve_topology=True)
-    original_vertices = len(poly.exterior.coords)
-    simplified_vertices = len(simplified.exterior.coords)
     
-    logger.debug(
-        f"Simplified polygon from {original_vertices} to {simplified_vertices} vertices "
-        f"(tolerance={tolerance}°)"
-    )
+    # Vertex counts are only needed for the log line
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Simplified polygon from %d to %d vertices (tolerance=%s°)",
+            shapely.get_num_coordinates(poly), shapely.get_num_coordinates(simplified), tolerance
+        )
     
     return simplified